@@ -1,36 +1,256 @@
+import hashlib
+import json
+import logging
 import os
 import shutil
 import tempfile
-import uuid
-from typing import Optional, Union
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, BinaryIO, Dict, Hashable, Iterator, Optional, Tuple, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows: only the in-process lock applies
+    fcntl = None
 
 from fastapi import HTTPException, UploadFile
+from starlette.concurrency import run_in_threadpool
 
+logger = logging.getLogger(__name__)
 
-async def save_upload_to_tmpdir(
-    upload_file: UploadFile,
-    suffix: str,
-    chunk_size: int = 1024 * 1024,
-) -> tuple[str, str, int]:
-    tmpdir = tempfile.mkdtemp()
-    path = os.path.join(tmpdir, f"{uuid.uuid4()}.{suffix}")
+# 8 MiB: large CityGML uploads (100MB+) need few read/write round trips
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+
+def create_request_workdir() -> str:
+    """Per-request scratch directory holding both the upload and its outputs."""
+    return tempfile.mkdtemp(prefix="papercad_")
+
+
+def _copy_and_hash(src: BinaryIO, dst_path: str, chunk_size: int) -> tuple[int, str]:
+    hasher = hashlib.blake2b(digest_size=16)
     total = 0
-    with open(path, "wb") as dst:
+    src.seek(0)
+    with open(dst_path, "wb") as dst:
         while True:
-            chunk = await upload_file.read(chunk_size)
+            chunk = src.read(chunk_size)
             if not chunk:
                 break
             total += len(chunk)
+            hasher.update(chunk)
             dst.write(chunk)
+    return total, hasher.hexdigest()
+
+
+async def save_upload_with_digest(
+    upload_file: UploadFile,
+    suffix: str,
+    chunk_size: int = UPLOAD_CHUNK_SIZE,
+    tmpdir: Optional[str] = None,
+) -> tuple[str, str, int, str]:
+    """Save an upload in chunks, hashing it on the way; returns (tmpdir, path, size, digest)."""
+    # Reuse the caller's work directory when given (one mkdtemp per request)
+    if tmpdir is None:
+        tmpdir = create_request_workdir()
+    part_path = os.path.join(tmpdir, f"upload.{suffix}.part")
+    # The multipart parser has already spooled the body into upload_file.file;
+    # copy it in one threadpool call instead of awaiting read() and write()
+    # separately for every chunk
+    total, digest = await run_in_threadpool(_copy_and_hash, upload_file.file, part_path, chunk_size)
+    path = os.path.join(tmpdir, f"{digest}.{suffix}")
+    os.replace(part_path, path)
+    return tmpdir, path, total, digest
+
+
+async def save_upload_to_tmpdir(
+    upload_file: UploadFile,
+    suffix: str,
+    chunk_size: int = UPLOAD_CHUNK_SIZE,
+    tmpdir: Optional[str] = None,
+) -> tuple[str, str, int]:
+    tmpdir, path, total, _ = await save_upload_with_digest(upload_file, suffix, chunk_size, tmpdir)
     return tmpdir, path, total
 
 
+# --- Output cache for repeated uploads ---
+# Keyed by (upload digest, conversion parameters); identical re-uploads are
+# served from here without running OpenCASCADE again. All uvicorn workers
+# share one directory, so hits are shared too, and the entry-count and
+# byte bounds (STEP outputs can exceed 100MB each) hold for the whole
+# host. Each entry is a data file plus a "<name>.json" record; the
+# record's mtime marks last use for LRU eviction. Every read or change of
+# the directory happens under an exclusive flock on its ".lock" file.
+OUTPUT_CACHE_CAPACITY = 64
+OUTPUT_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+OUTPUT_CACHE_DIR = os.path.join(tempfile.gettempdir(), "papercad_output_cache")
+# Staging files older than this were left by a crashed worker
+_OUTPUT_CACHE_PART_MAX_AGE = 60 * 60
+_output_cache_lock = threading.Lock()
+
+
+@contextmanager
+def _output_cache_locked() -> Iterator[None]:
+    """Hold the cross-process cache lock (in-process lock only without fcntl)."""
+    os.makedirs(OUTPUT_CACHE_DIR, exist_ok=True)
+    with _output_cache_lock, open(os.path.join(OUTPUT_CACHE_DIR, ".lock"), "a") as lock_file:
+        if fcntl is not None:
+            # Released when lock_file is closed
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        yield
+
+
+def _output_cache_name(key: Hashable) -> str:
+    # Keys are tuples of str/number/bool/None, whose repr is stable across processes
+    return hashlib.blake2b(repr(key).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _read_cache_record(record_path: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(record_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def prune_output_cache_dir() -> None:
+    """
+    Clean up the shared cache directory at startup.
+
+    Removes leftovers of crashed workers (stale staging files, data files
+    without a record) and per-PID directories of older versions, then
+    applies the size bounds.
+    """
+    try:
+        with _output_cache_locked():
+            now = time.time()
+            with os.scandir(OUTPUT_CACHE_DIR) as entries:
+                names = {entry.name: entry for entry in entries}
+            for name, entry in names.items():
+                if entry.is_dir(follow_symlinks=False):
+                    cleanup_temp_dir(entry.path, label="output cache")
+                elif name.endswith(".part"):
+                    if now - entry.stat().st_mtime > _OUTPUT_CACHE_PART_MAX_AGE:
+                        _remove_quietly(entry.path)
+                elif name != ".lock" and not name.endswith(".json"):
+                    if os.path.splitext(name)[0] + ".json" not in names:
+                        _remove_quietly(entry.path)
+            _enforce_output_cache_bounds_locked()
+    except OSError as e:
+        logger.warning("[CACHE] Failed to prune %s: %s", OUTPUT_CACHE_DIR, e)
+
+
+def get_cached_output(key: Hashable, dest_dir: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """
+    Return (path, meta) for a cached output, or None on a miss.
+
+    The cached file is hard-linked into dest_dir (the request work dir)
+    while the lock is held, so a concurrent eviction cannot remove it
+    before the response has opened it.
+    """
+    name = _output_cache_name(key)
+    try:
+        with _output_cache_locked():
+            record_path = os.path.join(OUTPUT_CACHE_DIR, f"{name}.json")
+            record = _read_cache_record(record_path)
+            if record is None or record.get("key") != repr(key):
+                return None
+            cached_path = os.path.join(OUTPUT_CACHE_DIR, record["file"])
+            link_path = os.path.join(dest_dir, f"cached_{record['file']}")
+            try:
+                os.link(cached_path, link_path)
+            except OSError:
+                # Missing or on another filesystem: treat as a miss
+                _remove_quietly(record_path)
+                _remove_quietly(cached_path)
+                return None
+            os.utime(record_path)
+            return link_path, dict(record.get("meta") or {})
+    except OSError as e:
+        logger.warning("[CACHE] Failed to read cached output: %s", e)
+        return None
+
+
+def store_cached_output(key: Hashable, src_path: str, meta: Optional[Dict[str, Any]] = None) -> None:
+    """Keep a copy of src_path in the cache, evicting least recently used entries."""
+    size = os.path.getsize(src_path)
+    if size > OUTPUT_CACHE_MAX_BYTES:
+        return
+
+    name = _output_cache_name(key)
+    data_name = name + os.path.splitext(src_path)[1]
+    part_path = None
+    try:
+        os.makedirs(OUTPUT_CACHE_DIR, exist_ok=True)
+        # Stage outside the lock: copying a large output must not block
+        # other workers' lookups
+        fd, part_path = tempfile.mkstemp(dir=OUTPUT_CACHE_DIR, suffix=".part")
+        os.close(fd)
+        link_path = part_path + ".link"
+        try:
+            # Hard link when on the same filesystem, copy otherwise
+            os.link(src_path, link_path)
+            os.replace(link_path, part_path)
+        except OSError:
+            _remove_quietly(link_path)
+            shutil.copyfile(src_path, part_path)
+
+        record = {"key": repr(key), "file": data_name, "meta": dict(meta or {})}
+        with _output_cache_locked():
+            # A request serving the previous file holds its own hard link
+            os.replace(part_path, os.path.join(OUTPUT_CACHE_DIR, data_name))
+            part_path = None
+            with open(os.path.join(OUTPUT_CACHE_DIR, f"{name}.json"), "w", encoding="utf-8") as f:
+                json.dump(record, f)
+            _enforce_output_cache_bounds_locked()
+    except (OSError, TypeError, ValueError) as e:
+        logger.warning("[CACHE] Failed to store output %s: %s", src_path, e)
+        if part_path:
+            _remove_quietly(part_path)
+
+
+def _enforce_output_cache_bounds_locked() -> None:
+    """Evict least recently used entries until both bounds hold; caller holds the lock."""
+    entries = []
+    with os.scandir(OUTPUT_CACHE_DIR) as it:
+        for entry in it:
+            if not entry.name.endswith(".json"):
+                continue
+            record = _read_cache_record(entry.path) or {}
+            data_path = os.path.join(OUTPUT_CACHE_DIR, record["file"]) if "file" in record else None
+            try:
+                size = os.path.getsize(data_path) if data_path else 0
+                last_used = entry.stat().st_mtime
+            except OSError:
+                size, last_used = 0, 0.0
+            entries.append((last_used, entry.path, data_path, size))
+
+    entries.sort(key=lambda item: item[0])
+    count = len(entries)
+    total = sum(item[3] for item in entries)
+    for _, record_path, data_path, size in entries:
+        if count <= OUTPUT_CACHE_CAPACITY and total <= OUTPUT_CACHE_MAX_BYTES:
+            break
+        _remove_quietly(record_path)
+        if data_path:
+            _remove_quietly(data_path)
+        count -= 1
+        total -= size
+
+
+def _remove_quietly(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
 def cleanup_temp_dir(tmpdir: Optional[str], label: str = "tmpdir") -> None:
     if tmpdir and os.path.exists(tmpdir):
         try:
             shutil.rmtree(tmpdir)
         except Exception as e:
-            print(f"[CLEANUP] Failed to remove {label} {tmpdir}: {e}")
+            logger.warning("[CLEANUP] Failed to remove %s %s: %s", label, tmpdir, e)
 
 
 def parse_csv_ids(value: Optional[str]) -> Optional[list[str]]:
@@ -1,14 +1,26 @@
+import logging
 import os
-import tempfile
 from typing import Optional, Union
 
 from fastapi import APIRouter, BackgroundTasks, File, Form, HTTPException, Request, UploadFile
 from fastapi.responses import FileResponse
-
-from api.helpers import cleanup_temp_dir, normalize_limit_param, parse_csv_ids, save_upload_to_tmpdir
+from starlette.concurrency import run_in_threadpool
+
+from api.helpers import (
+    cleanup_temp_dir,
+    create_request_workdir,
+    get_cached_output,
+    normalize_limit_param,
+    parse_csv_ids,
+    save_upload_to_tmpdir,
+    save_upload_with_digest,
+    store_cached_output,
+)
 from services.citygml import export_step_from_citygml
 from services.citygml.lod.footprint_extractor import parse_citygml_footprints
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 
@@ -145,8 +157,9 @@ async def citygml_to_step(
     - Units: MM, Precision: 1e-6
     - Custom headers: X-Building-Count, X-Method, X-Precision-Mode, X-Shape-Fix-Level
     """
-    tmpdir = None
-    out_dir = None
+    # 入力アップロードと出力STEPを1つの作業ディレクトリにまとめる
+    workdir = create_request_workdir()
+    upload_digest = None
     success = False
     try:
         # Normalize limit parameter (handle empty string from form)
@@ -196,18 +209,17 @@ async def citygml_to_step(
                     status_code=413,
                     detail="ファイルサイズが大きすぎます（最大250MB）。より小さいファイルを使用するか、limitパラメータで処理する建物数を制限してください。"
                 )
-            tmpdir, in_path, total = await save_upload_to_tmpdir(file, "gml")
+            _, in_path, total, upload_digest = await save_upload_with_digest(file, "gml", tmpdir=workdir)
             if total == 0:
                 raise HTTPException(status_code=400, detail="アップロードされたファイルが空です。")
-            print(f"[UPLOAD] /api/citygml/to-step: received {total} bytes -> {in_path}")
+            logger.info("[UPLOAD] /api/citygml/to-step: received %s bytes -> %s", total, in_path)
         else:
             in_path = normalized_gml_path  # type: ignore
             if not os.path.exists(in_path):
                 raise HTTPException(status_code=404, detail=f"指定されたパスが見つかりません: {in_path}")
-            print(f"[UPLOAD] /api/citygml/to-step: using local path {in_path}")
+            logger.info("[UPLOAD] /api/citygml/to-step: using local path %s", in_path)
 
         # 出力パス
-        out_dir = tempfile.mkdtemp()
         # 入力ファイル名からベース名を取得
         if file is not None:
             base_name = os.path.splitext(os.path.basename(file.filename))[0]
@@ -216,9 +228,42 @@ async def citygml_to_step(
         else:
             base_name = "citygml"
         output_filename = f"{base_name}.step"
-        out_path = os.path.join(out_dir, output_filename)
+        out_path = os.path.join(workdir, output_filename)
+
+        # 同一アップロード・同一パラメータなら前回の変換結果を再利用
+        cache_key = None
+        if upload_digest is not None:
+            cache_key = (
+                "citygml_to_step",
+                upload_digest,
+                normalized_limit,
+                debug,
+                method,
+                normalized_reproject_to,
+                normalized_source_crs,
+                auto_reproject,
+                normalized_precision_mode,
+                normalized_shape_fix_level,
+                tuple(normalized_building_ids) if normalized_building_ids else None,
+                normalized_filter_attribute,
+            )
+            cached = get_cached_output(cache_key, workdir)
+            if cached is not None:
+                cached_path, _ = cached
+                logger.info("[CACHE] /api/citygml/to-step: reusing %s", cached_path)
+                background_tasks.add_task(cleanup_temp_dir, workdir, "workdir")
+                success = True
+                return FileResponse(
+                    path=cached_path,
+                    media_type="application/octet-stream",
+                    filename=output_filename,
+                    headers={
+                        "Cache-Control": "no-cache"
+                    }
+                )
 
-        ok, msg = export_step_from_citygml(
+        ok, msg = await run_in_threadpool(
+            export_step_from_citygml,
             in_path,
             out_path,
             limit=normalized_limit,
@@ -237,23 +282,14 @@ async def citygml_to_step(
 
         # ファイルサイズを取得してログ出力
         file_size = os.path.getsize(out_path)
-        print(f"[RESPONSE] Generated STEP file: {output_filename} ({file_size:,} bytes)")
-
-        # クリーンアップ関数を定義
-        def cleanup_temp_files():
-            try:
-                if os.path.exists(out_path):
-                    os.remove(out_path)
-                if os.path.exists(out_dir):
-                    os.rmdir(out_dir)
-                print(f"[CLEANUP] Removed temporary files: {out_path}")
-            except Exception as e:
-                print(f"[CLEANUP] Failed to remove temporary files: {e}")
-
-        # レスポンス送信後にクリーンアップをスケジュール
-        background_tasks.add_task(cleanup_temp_files)
-
-        # FileResponseを使用して大容量ファイルを効率的にストリーミング
+        logger.info("[RESPONSE] Generated STEP file: %s (%d bytes)", output_filename, file_size)
+        if cache_key is not None:
+            store_cached_output(cache_key, out_path)
+
+        # レスポンス送信後に作業ディレクトリごと削除（アップロードファイルも含む）
+        background_tasks.add_task(cleanup_temp_dir, workdir, "workdir")
+
+        # FileResponseでディスクから直接ストリーミング（メモリに読み込まない）
         # Note: CORS headers are automatically handled by CORSMiddleware
         success = True
         return FileResponse(
@@ -267,15 +303,13 @@ async def citygml_to_step(
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        logger.exception("[ERROR] /api/citygml/to-step failed")
         raise HTTPException(status_code=500, detail=f"予期しないエラー: {str(e)}")
     finally:
         # エラー時の一時ディレクトリクリーンアップ
         # 成功時はbackground_tasksが処理するため、エラー時のみクリーンアップ
         if not success:
-            cleanup_temp_dir(tmpdir, label="tmpdir")
-            cleanup_temp_dir(out_dir, label="out_dir")
+            cleanup_temp_dir(workdir, label="workdir")
 
 
 # --- CityGML 検証（簡易） ---
@@ -331,12 +365,12 @@ async def citygml_validate(
             tmpdir, in_path, total = await save_upload_to_tmpdir(file, "gml")
             if total == 0:
                 raise HTTPException(status_code=400, detail="アップロードされたファイルが空です。")
-            print(f"[UPLOAD] /api/citygml/validate: received {total} bytes -> {in_path}")
+            logger.info("[UPLOAD] /api/citygml/validate: received %s bytes -> %s", total, in_path)
         else:
             in_path = gml_path  # type: ignore
             if not os.path.exists(in_path):
                 raise HTTPException(status_code=404, detail=f"指定されたパスが見つかりません: {in_path}")
-            print(f"[UPLOAD] /api/citygml/validate: using local path {in_path}")
+            logger.info("[UPLOAD] /api/citygml/validate: using local path %s", in_path)
 
         fps = parse_citygml_footprints(in_path, limit=limit or None)
         return {
@@ -348,8 +382,7 @@ async def citygml_validate(
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        logger.exception("[ERROR] /api/citygml/validate failed")
         raise HTTPException(status_code=500, detail=f"検証でエラー: {str(e)}")
     finally:
         cleanup_temp_dir(tmpdir, label="tmpdir")
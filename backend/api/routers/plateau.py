@@ -1,3 +1,4 @@
+import logging
 import os
 import tempfile
 import uuid
@@ -5,6 +6,7 @@ from typing import Optional, Union
 
 from fastapi import APIRouter, BackgroundTasks, Form, HTTPException
 from fastapi.responses import FileResponse
+from starlette.concurrency import run_in_threadpool
 
 from api.helpers import cleanup_temp_dir, normalize_limit_param, parse_csv_ids
 from config import OCCT_AVAILABLE
@@ -31,6 +33,8 @@ from services.plateau_fetcher import (
     search_buildings_by_address,
 )
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 
@@ -114,12 +118,12 @@ async def plateau_search_by_address(
         ```
     """
     try:
-        print(f"\n{'='*60}")
-        print(f"[API] /api/plateau/search-by-address")
-        print(f"[API] Query: {request.query}")
-        print(f"[API] Radius: {request.radius} degrees")
-        print(f"[API] Limit: {request.limit}")
-        print(f"{'='*60}\n")
+        logger.info(
+            "[API] /api/plateau/search-by-address (Query: %s, Radius: %s degrees, Limit: %s)",
+            request.query,
+            request.radius,
+            request.limit,
+        )
 
         # Call the search function with name_filter and search_mode
         result = search_buildings_by_address(
@@ -182,8 +186,7 @@ async def plateau_search_by_address(
         )
 
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        logger.exception("[ERROR] /api/plateau/search-by-address failed")
         raise HTTPException(status_code=500, detail=f"検索エラー: {str(e)}")
 
 
@@ -256,13 +259,13 @@ async def plateau_fetch_and_convert(
         # Normalize building_ids parameter (comma-separated string to list)
         normalized_building_ids = parse_csv_ids(building_ids)
 
-        print(f"\n{'='*60}")
-        print(f"[API] /api/plateau/fetch-and-convert")
-        print(f"[API] Query: {query}")
-        print(f"[API] Radius: {radius} degrees")
-        print(f"[API] Building limit: {normalized_building_limit if normalized_building_limit else 'unlimited'}")
-        print(f"[API] User-selected building IDs: {normalized_building_ids if normalized_building_ids else 'None (auto-select)'}")
-        print(f"{'='*60}\n")
+        logger.info(
+            "[API] /api/plateau/fetch-and-convert (Query: %s, Radius: %s degrees, Building limit: %s, User-selected building IDs: %s)",
+            query,
+            radius,
+            normalized_building_limit if normalized_building_limit else "unlimited",
+            normalized_building_ids if normalized_building_ids else "None (auto-select)",
+        )
 
         # Step 1: Search for buildings
         search_result = search_buildings_by_address(
@@ -288,7 +291,7 @@ async def plateau_fetch_and_convert(
         if normalized_building_ids:
             # User explicitly selected specific buildings - use those IDs directly
             final_building_ids = normalized_building_ids
-            print(f"[API] Using {len(final_building_ids)} user-selected building(s):")
+            logger.info("[API] Using %s user-selected building(s):", len(final_building_ids))
 
             # Find LOD information for selected buildings
             for i, bid in enumerate(final_building_ids, 1):
@@ -305,17 +308,17 @@ async def plateau_fetch_and_convert(
 
                     height = matching_building.measured_height or matching_building.height or 0
                     name_str = f'"{matching_building.name}"' if matching_building.name else "unnamed"
-                    print(f"[API LOD INFO]   {i}. {name_str} ({', '.join(lod_str)})")
-                    print(f"[API LOD INFO]      ID: {bid[:50]}...")
-                    print(f"[API LOD INFO]      Height: {height:.1f}m, Distance: {matching_building.distance_meters:.1f}m")
+                    logger.debug("[API LOD INFO]   %s. %s (%s)", i, name_str, ', '.join(lod_str))
+                    logger.debug("[API LOD INFO]      ID: %s...", bid[:50])
+                    logger.debug("[API LOD INFO]      Height: %.1fm, Distance: %.1fm", height, matching_building.distance_meters)
                 else:
-                    print(f"[API]   {i}. {bid[:50]}... (LOD info unavailable)")
+                    logger.debug("[API]   %s. %s... (LOD info unavailable)", i, bid[:50])
         else:
             # No user selection - fall back to auto-selection from search results
             selected_buildings = buildings[:normalized_building_limit] if normalized_building_limit else buildings
             final_building_ids = [b.gml_id for b in selected_buildings]  # Always use gml:id
 
-            print(f"[API] Auto-selected {len(final_building_ids)} building(s) by smart scoring:")
+            logger.info("[API] Auto-selected %s building(s) by smart scoring:", len(final_building_ids))
             for i, (bid, b) in enumerate(zip(final_building_ids, selected_buildings), 1):
                 lod_str = []
                 if b.has_lod3:
@@ -327,8 +330,8 @@ async def plateau_fetch_and_convert(
 
                 height = b.measured_height or b.height or 0
                 name_str = f'"{b.name}"' if b.name else "unnamed"
-                print(f"[API LOD INFO]   {i}. {name_str} ({', '.join(lod_str)}) - {height:.1f}m, {b.distance_meters:.1f}m away")
-                print(f"[API LOD INFO]      ID: {bid[:30]}...")
+                logger.debug("[API LOD INFO]   %s. %s (%s) - %.1fm, %.1fm away", i, name_str, ', '.join(lod_str), height, b.distance_meters)
+                logger.debug("[API LOD INFO]      ID: %s...", bid[:30])
 
         # Step 3: Reuse CityGML XML from search results (no re-fetch needed!)
         xml_content = search_result.get("citygml_xml")
@@ -339,7 +342,7 @@ async def plateau_fetch_and_convert(
                 detail="CityGMLデータの取得に失敗しました"
             )
 
-        print(f"[API] Reusing CityGML from search results ({len(xml_content):,} bytes)")
+        logger.info("[API] Reusing CityGML from search results (%d bytes)", len(xml_content))
 
         # Step 4: Save CityGML to temp file
         tmpdir = tempfile.mkdtemp()
@@ -353,7 +356,8 @@ async def plateau_fetch_and_convert(
         output_filename = "plateau_building.step"
         out_path = os.path.join(out_dir, output_filename)
 
-        ok, msg = export_step_from_citygml(
+        ok, msg = await run_in_threadpool(
+            export_step_from_citygml,
             gml_path,
             out_path,
             limit=None,  # Don't use limit - we filter by building_ids instead
@@ -376,7 +380,7 @@ async def plateau_fetch_and_convert(
 
         # Step 6: Return STEP file
         file_size = os.path.getsize(out_path)
-        print(f"[API] Success: Generated {output_filename} ({file_size:,} bytes)")
+        logger.info("[API] Success: Generated %s (%d bytes)", output_filename, file_size)
 
         # Cleanup function
         def cleanup_temp_files():
@@ -389,9 +393,9 @@ async def plateau_fetch_and_convert(
                     os.remove(out_path)
                 if os.path.exists(out_dir):
                     os.rmdir(out_dir)
-                print(f"[CLEANUP] Removed temporary files")
+                logger.info("[CLEANUP] Removed temporary files")
             except Exception as e:
-                print(f"[CLEANUP] Failed: {e}")
+                logger.warning("[CLEANUP] Failed: %s", e)
 
         background_tasks.add_task(cleanup_temp_files)
 
@@ -408,8 +412,7 @@ async def plateau_fetch_and_convert(
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        logger.exception("[ERROR] /api/plateau/fetch-and-convert failed")
         raise HTTPException(status_code=500, detail=f"予期しないエラー: {str(e)}")
     finally:
         # エラー時の一時ディレクトリクリーンアップ
@@ -481,10 +484,10 @@ async def plateau_search_by_building_id(request: PlateauBuildingIdRequest):
     - CityGMLファイル情報を返却 / Returns CityGML file information
     """
     try:
-        print(f"\n{'='*60}")
-        print(f"[API] /api/plateau/search-by-id")
-        print(f"[API] Building ID: {request.building_id}")
-        print(f"{'='*60}\n")
+        logger.info(
+            "[API] /api/plateau/search-by-id (Building ID: %s)",
+            request.building_id,
+        )
 
         # Search for building by ID
         result = search_building_by_id(request.building_id, debug=request.debug)
@@ -534,8 +537,7 @@ async def plateau_search_by_building_id(request: PlateauBuildingIdRequest):
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        logger.exception("[ERROR] /api/plateau/search-by-id failed")
         return PlateauBuildingIdSearchResponse(
             success=False,
             building=None,
@@ -591,12 +593,12 @@ async def plateau_fetch_by_building_id(request: PlateauBuildingIdRequest):
         )
 
     try:
-        print(f"\n{'='*60}")
-        print(f"[API] /api/plateau/fetch-by-id")
-        print(f"[API] Building ID: {request.building_id}")
-        print(f"[API] Precision Mode: {request.precision_mode}")
-        print(f"[API] Shape Fix Level: {request.shape_fix_level}")
-        print(f"{'='*60}\n")
+        logger.info(
+            "[API] /api/plateau/fetch-by-id (Building ID: %s, Precision Mode: %s, Shape Fix Level: %s)",
+            request.building_id,
+            request.precision_mode,
+            request.shape_fix_level,
+        )
 
         # Step 1: Search for building by ID
         search_result = search_building_by_id(request.building_id, debug=request.debug)
@@ -628,7 +630,8 @@ async def plateau_fetch_by_building_id(request: PlateauBuildingIdRequest):
 
         try:
             # Export to STEP with specified building ID filter
-            success, message = export_step_from_citygml(
+            success, message = await run_in_threadpool(
+                export_step_from_citygml,
                 tmp_gml_path,
                 tmp_step_path,
                 building_ids=[request.building_id],
@@ -649,7 +652,7 @@ async def plateau_fetch_by_building_id(request: PlateauBuildingIdRequest):
                 raise HTTPException(status_code=500, detail="STEP file was not created")
 
             # Return STEP file
-            print(f"[API] Success: Returning STEP file for building {request.building_id}")
+            logger.info("[API] Success: Returning STEP file for building %s", request.building_id)
             return FileResponse(
                 path=tmp_step_path,
                 media_type="application/octet-stream",
@@ -665,8 +668,7 @@ async def plateau_fetch_by_building_id(request: PlateauBuildingIdRequest):
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        logger.exception("[ERROR] /api/plateau/fetch-by-id failed")
         raise HTTPException(status_code=500, detail=f"予期しないエラー: {str(e)}")
 
 
@@ -730,11 +732,11 @@ async def plateau_search_by_id_and_mesh(request: PlateauBuildingIdWithMeshReques
     - 大量建物の一括処理 / Batch processing of many buildings
     """
     try:
-        print(f"\n{'='*60}")
-        print(f"[API] /api/plateau/search-by-id-and-mesh")
-        print(f"[API] Building ID: {request.building_id}")
-        print(f"[API] Mesh Code: {request.mesh_code}")
-        print(f"{'='*60}\n")
+        logger.info(
+            "[API] /api/plateau/search-by-id-and-mesh (Building ID: %s, Mesh Code: %s)",
+            request.building_id,
+            request.mesh_code,
+        )
 
         # Search for building by ID + mesh code
         result = search_building_by_id_and_mesh(
@@ -788,8 +790,7 @@ async def plateau_search_by_id_and_mesh(request: PlateauBuildingIdWithMeshReques
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        logger.exception("[ERROR] /api/plateau/search-by-id-and-mesh failed")
         return PlateauBuildingIdSearchResponse(
             success=False,
             building=None,
@@ -863,10 +864,10 @@ async def plateau_batch_search_buildings(request: PlateauBatchBuildingRequest):
     - 大量建物の一括処理 / Batch processing of many buildings
     """
     try:
-        print(f"\n{'='*60}")
-        print(f"[API] /api/plateau/buildings/batch")
-        print(f"[API] Total buildings requested: {len(request.buildings)}")
-        print(f"{'='*60}\n")
+        logger.info(
+            "[API] /api/plateau/buildings/batch (Total buildings requested: %s)",
+            len(request.buildings),
+        )
 
         results = []
         total_requested = len(request.buildings)
@@ -880,11 +881,11 @@ async def plateau_batch_search_buildings(request: PlateauBatchBuildingRequest):
                 mesh_groups[item.mesh_code] = []
             mesh_groups[item.mesh_code].append(item.building_id)
 
-        print(f"[API] Grouped into {len(mesh_groups)} mesh code(s)")
+        logger.info("[API] Grouped into %s mesh code(s)", len(mesh_groups))
 
         # Process each mesh group
         for mesh_code, building_ids in mesh_groups.items():
-            print(f"[API] Processing mesh {mesh_code}: {len(building_ids)} buildings")
+            logger.info("[API] Processing mesh %s: %s buildings", mesh_code, len(building_ids))
 
             for building_id in building_ids:
                 try:
@@ -942,7 +943,7 @@ async def plateau_batch_search_buildings(request: PlateauBatchBuildingRequest):
                         total_failed += 1
 
                 except Exception as e:
-                    print(f"[API] Error fetching building {building_id}: {str(e)}")
+                    logger.warning("[API] Error fetching building %s: %s", building_id, str(e))
                     results.append(PlateauBuildingIdSearchResponse(
                         success=False,
                         building=None,
@@ -955,7 +956,7 @@ async def plateau_batch_search_buildings(request: PlateauBatchBuildingRequest):
                     ))
                     total_failed += 1
 
-        print(f"[API] Batch complete: {total_success} success, {total_failed} failed")
+        logger.info("[API] Batch complete: %s success, %s failed", total_success, total_failed)
 
         return PlateauBatchBuildingResponse(
             results=results,
@@ -965,8 +966,7 @@ async def plateau_batch_search_buildings(request: PlateauBatchBuildingRequest):
         )
 
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        logger.exception("[ERROR] /api/plateau/buildings/batch failed")
         raise HTTPException(status_code=500, detail=f"バッチ検索エラー: {str(e)}")
 
 
@@ -1017,13 +1017,13 @@ async def plateau_fetch_by_id_and_mesh(request: PlateauBuildingIdWithMeshRequest
         )
 
     try:
-        print(f"\n{'='*60}")
-        print(f"[API] /api/plateau/fetch-by-id-and-mesh")
-        print(f"[API] Building ID: {request.building_id}")
-        print(f"[API] Mesh Code: {request.mesh_code}")
-        print(f"[API] Precision Mode: {request.precision_mode}")
-        print(f"[API] Shape Fix Level: {request.shape_fix_level}")
-        print(f"{'='*60}\n")
+        logger.info(
+            "[API] /api/plateau/fetch-by-id-and-mesh (Building ID: %s, Mesh Code: %s, Precision Mode: %s, Shape Fix Level: %s)",
+            request.building_id,
+            request.mesh_code,
+            request.precision_mode,
+            request.shape_fix_level,
+        )
 
         # Step 1: Search for building by ID + mesh code
         search_result = search_building_by_id_and_mesh(
@@ -1059,7 +1059,8 @@ async def plateau_fetch_by_id_and_mesh(request: PlateauBuildingIdWithMeshRequest
 
         try:
             # Export to STEP with specified building ID filter
-            success, message = export_step_from_citygml(
+            success, message = await run_in_threadpool(
+                export_step_from_citygml,
                 tmp_gml_path,
                 tmp_step_path,
                 building_ids=[request.building_id],
@@ -1080,7 +1081,7 @@ async def plateau_fetch_by_id_and_mesh(request: PlateauBuildingIdWithMeshRequest
                 raise HTTPException(status_code=500, detail="STEP file was not created")
 
             # Return STEP file
-            print(f"[API] Success: Returning STEP file for building {request.building_id}")
+            logger.info("[API] Success: Returning STEP file for building %s", request.building_id)
             return FileResponse(
                 path=tmp_step_path,
                 media_type="application/octet-stream",
@@ -1096,8 +1097,7 @@ async def plateau_fetch_by_id_and_mesh(request: PlateauBuildingIdWithMeshRequest
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        logger.exception("[ERROR] /api/plateau/fetch-by-id-and-mesh failed")
         raise HTTPException(status_code=500, detail=f"予期しないエラー: {str(e)}")
 
 
@@ -1176,12 +1176,12 @@ async def mesh_to_tilesets(request: MeshToTilesetsRequest) -> MeshToTilesetsResp
     - 同じ市区町村の重複したURLは除外されます
     """
     try:
-        print(f"\n{'='*60}")
-        print(f"[API] /api/plateau/mesh-to-tilesets")
-        print(f"[API] Mesh Codes: {request.mesh_codes}")
-        print(f"[API] LOD: {request.lod}")
-        print(f"[API] Prefer no texture: {request.prefer_no_texture}")
-        print(f"{'='*60}\n")
+        logger.info(
+            "[API] /api/plateau/mesh-to-tilesets (Mesh Codes: %s, LOD: %s, Prefer no texture: %s)",
+            request.mesh_codes,
+            request.lod,
+            request.prefer_no_texture,
+        )
 
         if request.municipality_code:
             dataset = await fetch_plateau_dataset_by_municipality(
@@ -1203,9 +1203,11 @@ async def mesh_to_tilesets(request: MeshToTilesetsRequest) -> MeshToTilesetsResp
                 total_found = len(tilesets)
                 total_not_found = total_requested - total_found
 
-                print(
-                    f"[API] Using municipality filter {request.municipality_code}: "
-                    f"Found {total_found}/{total_requested} tilesets"
+                logger.info(
+                    "[API] Using municipality filter %s: Found %s/%s tilesets",
+                    request.municipality_code,
+                    total_found,
+                    total_requested,
                 )
 
                 return MeshToTilesetsResponse(
@@ -1215,9 +1217,10 @@ async def mesh_to_tilesets(request: MeshToTilesetsRequest) -> MeshToTilesetsResp
                     total_not_found=total_not_found
                 )
 
-            print(
-                f"[API] Municipality {request.municipality_code} not found for LOD{request.lod}, "
-                "falling back to mesh lookup"
+            logger.warning(
+                "[API] Municipality %s not found for LOD%s, falling back to mesh lookup",
+                request.municipality_code,
+                request.lod,
             )
 
         # Fetch 3D Tiles URLs for mesh codes
@@ -1242,7 +1245,7 @@ async def mesh_to_tilesets(request: MeshToTilesetsRequest) -> MeshToTilesetsResp
         total_found = len(tilesets)
         total_not_found = total_requested - total_found
 
-        print(f"[API] Found {total_found}/{total_requested} tilesets")
+        logger.info("[API] Found %s/%s tilesets", total_found, total_requested)
 
         return MeshToTilesetsResponse(
             tilesets=tilesets,
@@ -1252,6 +1255,5 @@ async def mesh_to_tilesets(request: MeshToTilesetsRequest) -> MeshToTilesetsResp
         )
 
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        logger.exception("[ERROR] /api/plateau/mesh-to-tilesets failed")
         raise HTTPException(status_code=500, detail=f"予期しないエラー: {str(e)}")
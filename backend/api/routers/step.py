@@ -1,31 +1,63 @@
+import json
+import logging
 import os
-import tempfile
 import uuid
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, BackgroundTasks, File, Form, HTTPException, UploadFile
-from fastapi.responses import FileResponse
-
-from api.helpers import cleanup_temp_dir, save_upload_to_tmpdir
+from fastapi.responses import FileResponse, ORJSONResponse
+
+from api.helpers import (
+    cleanup_temp_dir,
+    create_request_workdir,
+    get_cached_output,
+    save_upload_to_tmpdir,
+    save_upload_with_digest,
+    store_cached_output,
+)
 from config import OCCT_AVAILABLE
 from models.request_models import BrepPapercraftRequest
 from services.step_processor import StepUnfoldGenerator
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 
+def _parse_texture_mappings(raw: str) -> Any:
+    # orjson.JSONDecodeError and json.JSONDecodeError are both ValueError subclasses
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_response(data: Dict[str, Any]) -> Any:
+    # SVG payloads can be several MB; serialize them in C and skip jsonable_encoder
+    if ORJSON_AVAILABLE:
+        return ORJSONResponse(data)
+    return data
+
+
 def _log_pdf_parameters(request: BrepPapercraftRequest) -> None:
-    print("[PDF] Parameters set:")
-    print(f"  scale_factor: {request.scale_factor}")
-    print(f"  units: {request.units}")
-    print(f"  tab_width: {request.tab_width}")
-    print(f"  show_scale: {request.show_scale}")
-    print(f"  show_fold_lines: {request.show_fold_lines}")
-    print(f"  show_cut_lines: {request.show_cut_lines}")
-    print(f"  layout_mode: {request.layout_mode}")
-    print(f"  page_format: {request.page_format}")
-    print(f"  page_orientation: {request.page_orientation}")
-    print(f"  mirror_horizontal: {request.mirror_horizontal}")
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    logger.debug("[PDF] Parameters set:")
+    logger.debug("  scale_factor: %s", request.scale_factor)
+    logger.debug("  units: %s", request.units)
+    logger.debug("  tab_width: %s", request.tab_width)
+    logger.debug("  show_scale: %s", request.show_scale)
+    logger.debug("  show_fold_lines: %s", request.show_fold_lines)
+    logger.debug("  show_cut_lines: %s", request.show_cut_lines)
+    logger.debug("  layout_mode: %s", request.layout_mode)
+    logger.debug("  page_format: %s", request.page_format)
+    logger.debug("  page_orientation: %s", request.page_orientation)
+    logger.debug("  mirror_horizontal: %s", request.mirror_horizontal)
 
 
 def _create_pdf_response_from_pages(
@@ -42,7 +74,7 @@ def _create_pdf_response_from_pages(
     result_path = generator.export_to_pdf_paged(paged_groups, pdf_path)
     resolved_page_count = page_count if page_count is not None else len(paged_groups)
 
-    print(f"[PDF] Generated PDF with {resolved_page_count} pages: {result_path}")
+    logger.info("[PDF] Generated PDF with %s pages: %s", resolved_page_count, result_path)
 
     response = FileResponse(
         path=result_path,
@@ -59,6 +91,26 @@ def _create_pdf_response_from_pages(
     return response, result_path
 
 
+def _svg_file_response(
+    svg_path: str,
+    layout_mode: str,
+    page_format: str,
+    page_orientation: str,
+    page_count: int
+) -> FileResponse:
+    return FileResponse(
+        path=svg_path,
+        media_type="image/svg+xml",
+        filename=f"step_unfold_{layout_mode}_{uuid.uuid4()}.svg",
+        headers={
+            "X-Layout-Mode": layout_mode,
+            "X-Page-Format": page_format if layout_mode == "paged" else "N/A",
+            "X-Page-Orientation": page_orientation if layout_mode == "paged" else "N/A",
+            "X-Page-Count": str(page_count) if layout_mode == "paged" else "1"
+        }
+    )
+
+
 # --- STEP専用APIエンドポイント ---
 @router.post(
     "/api/step/unfold",
@@ -150,8 +202,8 @@ async def unfold_step_to_svg(
     if not OCCT_AVAILABLE:
         raise HTTPException(status_code=503, detail="OpenCASCADE Technology が利用できません。STEPファイル処理に必要です。")
 
-    tmpdir = None
-    output_tmpdir = None
+    # 入力・出力ともに1リクエスト1ディレクトリにまとめる
+    workdir = create_request_workdir()
     success = False
     cleanup_in_background = False
     try:
@@ -161,28 +213,21 @@ async def unfold_step_to_svg(
 
         # 大容量でも安定するようチャンクで一時保存
         file_ext = "step" if file.filename.lower().endswith('.step') else "stp"
-        tmpdir, in_path, total = await save_upload_to_tmpdir(file, file_ext)
+        _, in_path, total, upload_digest = await save_upload_with_digest(file, file_ext, tmpdir=workdir)
         if total == 0:
             raise HTTPException(status_code=400, detail="アップロードされたファイルが空です。")
-        print(f"[UPLOAD] /api/step/unfold: received {total} bytes -> {in_path}")
+        logger.info("[UPLOAD] /api/step/unfold: received %s bytes -> %s", total, in_path)
 
         # テクスチャマッピングのパース
         parsed_texture_mappings = []
         if texture_mappings:
             try:
-                import json
-                parsed_texture_mappings = json.loads(texture_mappings)
-                print(f"[TEXTURE] Received texture mappings: {parsed_texture_mappings}")
-            except json.JSONDecodeError as e:
-                print(f"[TEXTURE] Failed to parse texture mappings: {e}")
+                parsed_texture_mappings = _parse_texture_mappings(texture_mappings)
+                logger.debug("[TEXTURE] Received texture mappings: %s", parsed_texture_mappings)
+            except ValueError as e:
+                logger.warning("[TEXTURE] Failed to parse texture mappings: %s", e)
                 # エラーを無視してテクスチャなしで続行
 
-        # StepUnfoldGeneratorインスタンスを作成
-        step_unfold_generator = StepUnfoldGenerator()
-
-        # 一時保存したファイルからロード
-        if not step_unfold_generator.load_from_file(in_path):
-            raise HTTPException(status_code=400, detail="STEPファイルの読み込みに失敗しました。")
         output_format_normalized = output_format.lower()
         supported_formats = {"svg", "json", "svg_pages", "pdf"}
         if output_format_normalized not in supported_formats:
@@ -196,6 +241,37 @@ async def unfold_step_to_svg(
                 detail="svg_pages/pdfの出力は layout_mode='paged' のみ対応しています。"
             )
 
+        # SVGファイル出力は入力とパラメータのみで決まるため、同一アップロードはキャッシュから返す
+        svg_cache_key = None
+        if output_format_normalized == "svg":
+            svg_cache_key = (
+                "step_unfold_svg",
+                upload_digest,
+                layout_mode,
+                page_format,
+                page_orientation,
+                scale_factor,
+                texture_mappings,
+                mirror_horizontal,
+            )
+            cached = get_cached_output(svg_cache_key, workdir)
+            if cached is not None:
+                cached_path, cached_meta = cached
+                logger.info("[CACHE] /api/step/unfold: reusing %s", cached_path)
+                cleanup_in_background = True
+                background_tasks.add_task(cleanup_temp_dir, workdir, "workdir")
+                success = True
+                return _svg_file_response(
+                    cached_path, layout_mode, page_format, page_orientation, cached_meta.get("page_count", 1)
+                )
+
+        # StepUnfoldGeneratorインスタンスを作成
+        step_unfold_generator = StepUnfoldGenerator()
+
+        # 一時保存したファイルからロード
+        if not step_unfold_generator.load_from_file(in_path):
+            raise HTTPException(status_code=400, detail="STEPファイルの読み込みに失敗しました。")
+
         # レイアウトオプションを含むBrepPapercraftRequestを作成
         request = BrepPapercraftRequest(
             layout_mode=layout_mode,
@@ -210,8 +286,7 @@ async def unfold_step_to_svg(
             step_unfold_generator.set_texture_mappings(parsed_texture_mappings)
 
         if output_format_normalized in {"svg", "json"}:
-            output_tmpdir = tempfile.mkdtemp()
-            output_path = os.path.join(output_tmpdir, f"step_unfold_{uuid.uuid4()}.svg")
+            output_path = os.path.join(workdir, f"step_unfold_{uuid.uuid4()}.svg")
             svg_path, stats = step_unfold_generator.generate_brep_papercraft(request, output_path)
 
             if output_format_normalized == "json":
@@ -229,36 +304,28 @@ async def unfold_step_to_svg(
                 try:
                     os.unlink(svg_path)
                 except OSError as e:
-                    print(f"[CLEANUP] Warning: Failed to remove {svg_path}: {e}")
+                    logger.warning("[CLEANUP] Warning: Failed to remove %s: %s", svg_path, e)
 
                 if return_face_numbers:
                     face_numbers = step_unfold_generator.get_face_numbers()
                     response_data["face_numbers"] = face_numbers
 
                 success = True
-                return response_data
+                return _json_response(response_data)
 
+            page_count = stats.get("page_count", 1)
+            store_cached_output(svg_cache_key, svg_path, {"page_count": page_count})
             cleanup_in_background = True
-            background_tasks.add_task(cleanup_temp_dir, tmpdir, "tmpdir")
-            background_tasks.add_task(cleanup_temp_dir, output_tmpdir, "output_tmpdir")
+            background_tasks.add_task(cleanup_temp_dir, workdir, "workdir")
             success = True
-            return FileResponse(
-                path=svg_path,
-                media_type="image/svg+xml",
-                filename=f"step_unfold_{layout_mode}_{uuid.uuid4()}.svg",
-                headers={
-                    "X-Layout-Mode": layout_mode,
-                    "X-Page-Format": page_format if layout_mode == "paged" else "N/A",
-                    "X-Page-Orientation": page_orientation if layout_mode == "paged" else "N/A",
-                    "X-Page-Count": str(stats.get("page_count", 1)) if layout_mode == "paged" else "1"
-                }
-            )
+            return _svg_file_response(svg_path, layout_mode, page_format, page_orientation, page_count)
 
         paged_groups, stats = step_unfold_generator.generate_brep_papercraft_pages(request)
 
         if output_format_normalized == "svg_pages":
-            output_tmpdir = tempfile.mkdtemp()
-            svg_paths = step_unfold_generator.export_to_svg_paged_files(paged_groups, output_tmpdir)
+            pages_dir = os.path.join(workdir, "pages")
+            os.mkdir(pages_dir)
+            svg_paths = step_unfold_generator.export_to_svg_paged_files(paged_groups, pages_dir)
 
             pages = []
             for svg_path in svg_paths:
@@ -278,17 +345,15 @@ async def unfold_step_to_svg(
                 response_data["face_numbers"] = face_numbers
 
             cleanup_in_background = True
-            background_tasks.add_task(cleanup_temp_dir, tmpdir, "tmpdir")
-            background_tasks.add_task(cleanup_temp_dir, output_tmpdir, "output_tmpdir")
+            background_tasks.add_task(cleanup_temp_dir, workdir, "workdir")
             success = True
-            return response_data
+            return _json_response(response_data)
 
         _log_pdf_parameters(request)
-        output_tmpdir = tempfile.mkdtemp()
         pdf_response, _ = _create_pdf_response_from_pages(
             step_unfold_generator,
             paged_groups,
-            output_tmpdir,
+            workdir,
             page_format,
             page_orientation,
             layout_mode,
@@ -297,22 +362,19 @@ async def unfold_step_to_svg(
         )
 
         cleanup_in_background = True
-        background_tasks.add_task(cleanup_temp_dir, tmpdir, "tmpdir")
-        background_tasks.add_task(cleanup_temp_dir, output_tmpdir, "output_tmpdir")
+        background_tasks.add_task(cleanup_temp_dir, workdir, "workdir")
         success = True
         return pdf_response
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        logger.exception("[ERROR] /api/step/unfold failed")
         raise HTTPException(status_code=500, detail=f"予期しないエラー: {str(e)}")
     finally:
         # BackgroundTasksを使わない場合は即時クリーンアップする
         if not cleanup_in_background or not success:
-            cleanup_temp_dir(tmpdir, label="tmpdir")
-            cleanup_temp_dir(output_tmpdir, label="output_tmpdir")
+            cleanup_temp_dir(workdir, label="workdir")
 
 
 # --- STEP → PDF 展開図エンドポイント ---
@@ -365,31 +427,30 @@ async def unfold_step_to_pdf(
     if not OCCT_AVAILABLE:
         raise HTTPException(status_code=503, detail="OpenCASCADE Technology が利用できません。STEPファイル処理に必要です。")
 
-    tmpdir = None
+    workdir = create_request_workdir()
     result_path = None  # PDFが正常に生成されたかを追跡
     try:
         # ファイル拡張子チェック
         if not (file.filename.lower().endswith('.step') or file.filename.lower().endswith('.stp')):
             raise HTTPException(status_code=400, detail="STEPファイル（.step/.stp）のみ対応です。")
 
-        # 一時ディレクトリ作成
+        # 作業ディレクトリに一時保存
         file_ext = "step" if file.filename.lower().endswith('.step') else "stp"
-        tmpdir, in_path, total = await save_upload_to_tmpdir(file, file_ext)
+        _, in_path, total = await save_upload_to_tmpdir(file, file_ext, tmpdir=workdir)
 
         if total == 0:
             raise HTTPException(status_code=400, detail="アップロードされたファイルが空です。")
 
-        print(f"[UPLOAD] /api/step/unfold-pdf: received {total} bytes -> {in_path}")
+        logger.info("[UPLOAD] /api/step/unfold-pdf: received %s bytes -> %s", total, in_path)
 
         # テクスチャマッピングのパース
         parsed_texture_mappings = []
         if texture_mappings:
             try:
-                import json
-                parsed_texture_mappings = json.loads(texture_mappings)
-                print(f"[TEXTURE] Parsed {len(parsed_texture_mappings)} texture mappings")
-            except json.JSONDecodeError as e:
-                print(f"[TEXTURE] Warning: Failed to parse texture_mappings: {e}")
+                parsed_texture_mappings = _parse_texture_mappings(texture_mappings)
+                logger.info("[TEXTURE] Parsed %s texture mappings", len(parsed_texture_mappings))
+            except ValueError as e:
+                logger.warning("[TEXTURE] Warning: Failed to parse texture_mappings: %s", e)
 
         generator = StepUnfoldGenerator()
         if not generator.load_from_file(in_path):
@@ -420,7 +481,7 @@ async def unfold_step_to_pdf(
         pdf_response, result_path = _create_pdf_response_from_pages(
             generator,
             paged_groups,
-            tmpdir,
+            workdir,
             page_format,
             page_orientation,
             layout_mode,
@@ -428,16 +489,15 @@ async def unfold_step_to_pdf(
             page_count=stats.get("page_count")
         )
 
-        background_tasks.add_task(cleanup_temp_dir, tmpdir, "tmpdir")
+        background_tasks.add_task(cleanup_temp_dir, workdir, "workdir")
         return pdf_response
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        logger.exception("[ERROR] /api/step/unfold-pdf failed")
         raise HTTPException(status_code=500, detail=f"PDFエクスポートエラー: {str(e)}")
     finally:
         # エラー時のみ即座にクリーンアップ（正常時はBackgroundTasksでクリーンアップ）
         if result_path is None:
-            cleanup_temp_dir(tmpdir, label="tmpdir")
+            cleanup_temp_dir(workdir, label="workdir")
@@ -1,3 +1,4 @@
+import logging
 import os
 import tempfile
 import uuid
@@ -10,6 +11,8 @@ from api.helpers import cleanup_temp_dir
 from config import SVG_UPLOAD_LIMITS
 from core.pdf_exporter import PDFExporter
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 MAX_SVG_FILES = SVG_UPLOAD_LIMITS["max_files"]
@@ -134,8 +137,7 @@ async def convert_svg_to_pdf(
     except RuntimeError as e:
         raise HTTPException(status_code=500, detail=str(e))
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        logger.exception("[ERROR] /api/svg/to-pdf failed")
         raise HTTPException(status_code=500, detail=f"SVG→PDFエクスポートエラー: {str(e)}")
     finally:
         if not cleanup_in_background or not success:
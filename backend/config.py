@@ -1,6 +1,10 @@
 import os
+import atexit
 import builtins
+import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -244,8 +248,42 @@ def setup_cors(app: FastAPI) -> None:
     for i, origin in enumerate(origins, 1):
         print(f"[CORS]   {i}. {origin}")
 
+# アプリケーションのロガー名前空間（ルートロガーやuvicornのロガーには触れない）
+APP_LOGGER_NAMESPACES = ("api", "services", "main")
+
+
+def setup_logging() -> None:
+    """
+    アプリのロガー（APP_LOGGER_NAMESPACES）をキュー経由のハンドラで構成する
+
+    リクエスト処理スレッドはキューに積むだけで、stdoutへの書き込みは
+    QueueListenerのスレッドが行うため、ログI/Oでリクエストが直列化しない。
+    ルートロガーは変更せず、propagate=False で二重出力を防ぐ。
+    レベルは LOG_LEVEL 環境変数で指定（demo/production の既定は WARNING）。
+    """
+    app_loggers = [logging.getLogger(name) for name in APP_LOGGER_NAMESPACES]
+    if any(isinstance(handler, QueueHandler) for handler in app_loggers[0].handlers):
+        return
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler(sys.stdout)
+    # 既存の print 出力（"[TAG] ..."）と同じ見た目を保つ
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    queue_handler = QueueHandler(log_queue)
+    default_level = "WARNING" if ENV in ["demo", "production"] else "INFO"
+    level = os.getenv("LOG_LEVEL", default_level).upper()
+    for app_logger in app_loggers:
+        app_logger.addHandler(queue_handler)
+        app_logger.setLevel(level)
+        app_logger.propagate = False
+
 def create_app() -> FastAPI:
     """FastAPIアプリケーションを作成する"""
+    setup_logging()
     app = FastAPI(**APP_CONFIG, openapi_tags=TAGS_METADATA)
     setup_cors(app)
     return app
@@ -32,6 +32,9 @@ class UnfoldEngine:
         
         # 展開グループ
         self.unfold_groups: List[List[int]] = []
+
+        # 面の隣接判定結果のキャッシュ（faces_dataが変わるまで有効）
+        self._adjacency_cache: Dict[Tuple[int, int, float], bool] = {}
     
     def set_geometry_data(self, faces_data: List[Dict], edges_data: List[Dict]):
         """
@@ -41,6 +44,8 @@ class UnfoldEngine:
             faces_data: 面データのリスト
             edges_data: エッジデータのリスト
         """
+        # 面データのリストは解析ごとに同一オブジェクトが再利用されるため、常にキャッシュを破棄する
+        self._adjacency_cache = {}
         self.faces_data = faces_data
         self.edges_data = edges_data
     
@@ -1797,6 +1802,12 @@ class UnfoldEngine:
         Returns:
             bool: 隣接している場合True
         """
+        # 同じ面ペアの判定はグループ化・展開で繰り返し呼ばれるためキャッシュする
+        cache_key = (face_idx1, face_idx2, tolerance)
+        cached = self._adjacency_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         face1 = self.faces_data[face_idx1]
         face2 = self.faces_data[face_idx2]
 
@@ -1812,6 +1823,7 @@ class UnfoldEngine:
                 vertices2.append(np.array(point))
 
         if not vertices1 or not vertices2:
+            self._adjacency_cache[cache_key] = False
             return False
 
         # 共有頂点を検出
@@ -1837,4 +1849,5 @@ class UnfoldEngine:
         if is_adjacent:
             print(f"      面{face_idx1} <-> 面{face_idx2}: 隣接（共有頂点数={len(shared_vertices)}）")
 
+        self._adjacency_cache[cache_key] = is_adjacent
         return is_adjacent
\ No newline at end of file
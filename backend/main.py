@@ -18,16 +18,20 @@ async def startup_event():
     サーバー起動時に実行される初期化処理
 
     - PLATEAU mesh2->municipality マッピングの構築
+    - 共有出力キャッシュの掃除（クラッシュの残骸とサイズ上限）
     """
     import logging
     logger = logging.getLogger(__name__)
 
+    from api.helpers import prune_output_cache_dir
+    prune_output_cache_dir()
+
     try:
         from services.plateau_api_client import _get_cached_mesh2_map
         await _get_cached_mesh2_map()
         logger.info("✅ PLATEAU mesh2->municipality map initialized successfully")
     except Exception as e:
-        logger.error(f"❌ Failed to initialize PLATEAU mesh mapping: {e}")
+        logger.error("❌ Failed to initialize PLATEAU mesh mapping: %s", e)
         logger.warning("PLATEAU search functionality may be limited")
 
 # ルートパスでAPI情報を返す
@@ -13,17 +13,29 @@ Key Components:
 - xlink_cache.py: Two-tier XLink resolution (local → global)
 - coordinate_optimizer.py: Optimized coordinate parsing (NumPy optional)
 - memory_profiler.py: Memory usage profiling utilities
+- parallel.py: Per-building coordinate parsing in worker processes
 """
 
 from .parser import stream_parse_buildings, StreamingConfig
+from .parallel import parallel_parse_buildings
 from .xlink_cache import LocalXLinkCache, resolve_xlink_lazy
-from .coordinate_optimizer import parse_poslist_optimized, parse_poslist_numpy
+from .coordinate_optimizer import (
+    parse_poslist_optimized,
+    parse_poslist_numpy,
+    parse_poslist_array,
+    parse_building_poslists,
+    CoordArrayView,
+)
 
 __all__ = [
     "stream_parse_buildings",
     "StreamingConfig",
+    "parallel_parse_buildings",
     "LocalXLinkCache",
     "resolve_xlink_lazy",
     "parse_poslist_optimized",
     "parse_poslist_numpy",
+    "parse_poslist_array",
+    "parse_building_poslists",
+    "CoordArrayView",
 ]
@@ -8,14 +8,23 @@ Features:
 2. Peak memory tracking
 3. Memory delta calculations
 4. Profile decorators for functions
+5. Zero-overhead peak RSS tracking (/proc VmHWM on Linux, getrusage elsewhere)
 """
 
 import tracemalloc
 import gc
+import sys
 from typing import Callable, Any, Tuple, Optional
 from functools import wraps
 from contextlib import contextmanager
 
+# resource is Unix-only; peak RSS profiling is unavailable on Windows
+try:
+    import resource
+    RUSAGE_AVAILABLE = True
+except ImportError:
+    RUSAGE_AVAILABLE = False
+
 
 class MemoryProfiler:
     """
@@ -115,6 +124,83 @@ class MemoryProfiler:
         print("=" * 70 + "\n")
 
 
+class MemoryProfilerRusage:
+    """
+    Coarse peak-RSS profiler with no overhead on the measured code.
+
+    Unlike tracemalloc, this includes native allocations (libxml2, NumPy
+    buffers). On Linux the peak comes from VmHWM in /proc/self/status,
+    which start() resets through /proc/self/clear_refs. ru_maxrss is not
+    used there because it survives fork+exec, so a spawned child would
+    start at its parent's high-water mark. Elsewhere ru_maxrss is the
+    fallback; it never decreases, so run each measurement in a fresh
+    process for comparable numbers.
+    """
+
+    def __init__(self):
+        """Initialize profiler."""
+        self.is_running = False
+        self.baseline = 0
+
+    @staticmethod
+    def _read_proc_status_kb(field: str) -> Optional[int]:
+        try:
+            with open("/proc/self/status", "r") as f:
+                for line in f:
+                    if line.startswith(field + ":"):
+                        return int(line.split()[1])
+        except (OSError, ValueError, IndexError):
+            pass
+        return None
+
+    @staticmethod
+    def _reset_peak_rss() -> bool:
+        """Reset VmHWM to the current RSS (Linux >= 4.0); False if unsupported."""
+        try:
+            with open("/proc/self/clear_refs", "w") as f:
+                f.write("5")
+            return True
+        except OSError:
+            return False
+
+    @classmethod
+    def get_peak_rss(cls) -> int:
+        """
+        Get the process peak RSS in bytes.
+
+        Returns:
+            Peak resident set size in bytes (0 if unavailable)
+        """
+        hwm_kb = cls._read_proc_status_kb("VmHWM")
+        if hwm_kb is not None:
+            return hwm_kb * 1024
+
+        if not RUSAGE_AVAILABLE:
+            return 0
+
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports kilobytes, macOS reports bytes
+        return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+    def start(self):
+        """Reset the peak where supported and record it as baseline."""
+        self._reset_peak_rss()
+        self.baseline = self.get_peak_rss()
+        self.is_running = True
+
+    def stop(self) -> int:
+        """
+        Stop profiling and return peak RSS growth.
+
+        Returns:
+            Bytes by which peak RSS grew since start()
+        """
+        if self.is_running:
+            self.is_running = False
+            return max(self.get_peak_rss() - self.baseline, 0)
+        return 0
+
+
 @contextmanager
 def profile_memory(label: str = "Operation", verbose: bool = True):
     """
@@ -0,0 +1,105 @@
+"""
+CityGML Parallel Coordinate Parsing
+
+Fans per-building posList parsing out to worker processes.
+
+Each building's subtree is independent (XLink references are resolved
+within the building), so the streaming parser serializes every selected
+Building to bytes and workers re-parse and extract its coordinates.
+
+Performance:
+- Scales with physical cores for coordinate-heavy files
+- Small inputs (< 2 x workers buildings) are processed inline
+
+Memory:
+- O(in-flight buildings): at most 4 x workers subtrees are queued
+"""
+
+import multiprocessing
+import os
+import xml.etree.ElementTree as ET
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Optional, Tuple
+
+from .coordinate_optimizer import parse_building_poslists
+from .parser import StreamingConfig, _ATTR_GML_ID, _stream_building_xml
+
+
+def _parse_building_coordinates(building_xml: bytes) -> Tuple[Optional[str], list]:
+    """
+    Worker: parse every gml:posList of one serialized building.
+
+    Returns:
+        (gml_id, [coordinates per posList in document order])
+    """
+    building = ET.fromstring(building_xml)
+    # One batched fromstring per building; ndarrays are cheap to pickle back
+    return building.get(_ATTR_GML_ID), parse_building_poslists(building)
+
+
+def parallel_parse_buildings(
+    gml_path: str,
+    workers: Optional[int] = None,
+    config: Optional[StreamingConfig] = None,
+) -> Iterator[Tuple[Optional[str], list]]:
+    """
+    Stream buildings and parse their posList coordinates in worker processes.
+
+    Buildings are selected exactly as in stream_parse_buildings() (limit,
+    building_ids, filter_attribute via config) and results are yielded in
+    document order.
+
+    Args:
+        gml_path: Path to CityGML file
+        workers: Worker process count (default: os.cpu_count())
+        config: Streaming configuration (limit, filtering, GC behaviour)
+
+    Yields:
+        Tuple of (gml_id, coords_per_poslist) for each building, where each
+        entry is an (N, 3)/(N, 2) ndarray from parse_poslist_array() (or a
+        list of tuples when NumPy is unavailable)
+
+    Example:
+        ```python
+        config = StreamingConfig(enable_gc_per_building=False)
+        for gml_id, rings in parallel_parse_buildings("tokyo_lod2.gml", config=config):
+            vertex_count = sum(len(r) for r in rings)
+        ```
+    """
+    workers = workers or os.cpu_count() or 1
+    buildings = _stream_building_xml(gml_path, config=config)
+
+    try:
+        # Buffer up to 2 x workers buildings; smaller inputs are not worth
+        # the process start-up cost and are parsed inline
+        head: List[bytes] = []
+        for building_xml in buildings:
+            head.append(building_xml)
+            if len(head) >= 2 * workers:
+                break
+
+        if workers == 1 or len(head) < 2 * workers:
+            for building_xml in head:
+                yield _parse_building_coordinates(building_xml)
+            for building_xml in buildings:
+                yield _parse_building_coordinates(building_xml)
+            return
+
+        # spawn: the API server is multi-threaded, so fork is unsafe
+        context = multiprocessing.get_context("spawn")
+        max_in_flight = 4 * workers
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            pending = deque(executor.submit(_parse_building_coordinates, b) for b in head)
+            head.clear()
+
+            for building_xml in buildings:
+                pending.append(executor.submit(_parse_building_coordinates, building_xml))
+                # Bounded window keeps memory flat and preserves order
+                while len(pending) >= max_in_flight:
+                    yield pending.popleft().result()
+
+            while pending:
+                yield pending.popleft().result()
+    finally:
+        buildings.close()
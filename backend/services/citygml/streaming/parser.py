@@ -7,7 +7,7 @@ Memory Usage: O(1 Building) ≈ 10-100MB (vs. legacy O(全ファイル) ≈ 20-5
 Processing: Linear scaling O(n) for unlimited buildings
 
 Architecture:
-1. ET.iterparse() - SAX-style event-driven parsing
+1. lxml/ET iterparse() - SAX-style event-driven parsing
 2. Building-level yielding - Process one building at a time
 3. Immediate memory release - elem.clear() after processing
 4. Early filtering - Apply limit/building_ids before full parse
@@ -15,13 +15,35 @@ Architecture:
 """
 
 import xml.etree.ElementTree as ET
-from typing import Iterator, Tuple, Dict, Optional, List, Set
+from itertools import chain
+from typing import Iterator, Tuple, Dict, Optional, List, FrozenSet
 from dataclasses import dataclass
 import gc
+import os
+
+# lxml (libxml2) is the preferred backend; xml.etree is the fallback
+try:
+    from lxml import etree as LET
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
 
 # Import namespace dict from parent module
 from ..core.constants import NS
 
+# Namespace-qualified names, built once instead of per element
+_NS_BLDG = NS["bldg"]
+_NS_GEN = NS["gen"]
+_TAG_BUILDING = f"{{{_NS_BLDG}}}Building"
+_ATTR_GML_ID = f"{{{NS['gml']}}}id"
+_TAG_GEN_NAME = f"{{{_NS_GEN}}}name"
+_TAG_GEN_VALUE = f"{{{_NS_GEN}}}value"
+_GEN_ATTRIBUTE_TAGS = frozenset(
+    f"{{{_NS_GEN}}}{name}" for name in ("stringAttribute", "intAttribute", "doubleAttribute")
+)
+
+_PARSE_ERRORS = (ET.ParseError, LET.ParseError) if LXML_AVAILABLE else (ET.ParseError,)
+
 
 @dataclass
 class StreamingConfig:
@@ -56,7 +78,7 @@ def _build_local_xlink_index(building_elem: ET.Element) -> Dict[str, ET.Element]
     """Build local XLink index for a building element."""
     index: Dict[str, ET.Element] = {}
     for elem in building_elem.iter():
-        gml_id = elem.get(f"{{{NS['gml']}}}id")
+        gml_id = elem.get(_ATTR_GML_ID)
         if gml_id:
             index[gml_id] = elem
     return index
@@ -76,14 +98,13 @@ def _extract_generic_attributes(building_elem: ET.Element) -> Dict[str, str]:
     """
     attrs = {}
 
-    # Find all gen:genericAttribute elements
-    gen_attrs = building_elem.findall(".//gen:stringAttribute", NS)
-    gen_attrs += building_elem.findall(".//gen:intAttribute", NS)
-    gen_attrs += building_elem.findall(".//gen:doubleAttribute", NS)
+    # Find all gen:genericAttribute elements (single pass, tag set lookup)
+    for attr in building_elem.iter():
+        if attr.tag not in _GEN_ATTRIBUTE_TAGS:
+            continue
 
-    for attr in gen_attrs:
-        name_elem = attr.find("gen:name", NS)
-        value_elem = attr.find("gen:value", NS)
+        name_elem = attr.find(_TAG_GEN_NAME)
+        value_elem = attr.find(_TAG_GEN_VALUE)
 
         if name_elem is not None and value_elem is not None:
             name = name_elem.text
@@ -94,6 +115,178 @@ def _extract_generic_attributes(building_elem: ET.Element) -> Dict[str, str]:
     return attrs
 
 
+def _iter_buildings_lxml(gml_path: str) -> Iterator["LET._Element"]:
+    """
+    Yield completed top-level Building elements using lxml.
+
+    libxml2 only reports Building end events (tag filter), so the Python
+    loop runs once per building instead of once per element. Processed
+    subtrees and their preceding siblings are deleted on resume.
+    """
+    context = LET.iterparse(gml_path, events=("end",), tag=_TAG_BUILDING, huge_tree=True)
+    for _, elem in context:
+        # Nested Building: part of the enclosing top-level building
+        if next(elem.iterancestors(_TAG_BUILDING), None) is not None:
+            continue
+
+        yield elem
+
+        # Release the building and everything parsed before it
+        elem.clear(keep_tail=True)
+        for node in chain((elem,), elem.iterancestors()):
+            while node.getprevious() is not None:
+                del node.getparent()[0]
+
+
+def _iter_buildings_etree(gml_path: str) -> Iterator[ET.Element]:
+    """
+    Yield completed top-level Building elements using xml.etree.
+
+    Fallback when lxml is not installed.
+    """
+    # Uses events=("start", "end") for full control over element lifecycle
+    context = iter(ET.iterparse(gml_path, events=("start", "end")))
+
+    # Get root element (needed for namespace info)
+    _, root = next(context)
+
+    # Open-element stack (root at the bottom) so parents are known in O(1)
+    # when an element ends, without rebuilding a parent map per building
+    elem_stack: List[ET.Element] = [root]
+    building_depth = 0  # Number of open Building elements
+
+    try:
+        for event, elem in context:
+            if event == "start":
+                elem_stack.append(elem)
+                if elem.tag == _TAG_BUILDING:
+                    building_depth += 1
+                continue
+
+            elem_stack.pop()
+            parent = elem_stack[-1] if elem_stack else None
+
+            if elem.tag == _TAG_BUILDING:
+                building_depth -= 1
+
+                # Process top-level building (not nested Building)
+                if building_depth == 0:
+                    yield elem
+
+                    # Clear completed building and detach it from its parent
+                    # (cityObjectMember); direct children of root are
+                    # recycled below
+                    elem.clear()
+                    if parent is not None and parent is not root:
+                        parent.remove(elem)
+
+            # Recycle finished top-level members (cityObjectMember,
+            # metadata) so the root never accumulates children
+            if parent is root and building_depth == 0:
+                elem.clear()
+                root.remove(elem)
+    finally:
+        root.clear()
+
+
+def _stream_building_xml(
+    gml_path: str,
+    limit: Optional[int] = None,
+    building_ids: Optional[List[str]] = None,
+    filter_attribute: str = "gml:id",
+    debug: bool = False,
+    config: Optional[StreamingConfig] = None,
+) -> Iterator[bytes]:
+    """
+    Yield each selected top-level Building serialized as XML bytes.
+
+    Shared driver behind stream_parse_buildings() and the parallel parser:
+    applies limit/building_ids filtering and releases the parser's working
+    tree per building. Arguments match stream_parse_buildings().
+    """
+    # Use config if provided
+    if config:
+        limit = config.limit
+        building_ids = config.building_ids
+        filter_attribute = config.filter_attribute
+        debug = config.debug
+
+    # Convert building_ids to frozenset for O(1) lookup
+    building_ids_set: Optional[FrozenSet[str]] = None
+    if building_ids:
+        building_ids_set = frozenset(building_ids)
+        _log(f"Filter by {len(building_ids)} building IDs (attribute: {filter_attribute})", debug)
+
+    # Early termination counter
+    processed_count = 0
+    skipped_count = 0
+
+    _log(f"Starting streaming parse: {gml_path}", debug)
+    _log(f"Limit: {limit if limit else 'unlimited'}", debug)
+
+    if not os.path.exists(gml_path):
+        _log(f"File not found: {gml_path}", debug=True)
+        raise FileNotFoundError(f"CityGML file not found: {gml_path}")
+
+    # SAX-style incremental parsing (libxml2 when available)
+    if LXML_AVAILABLE:
+        _log("Parsing XML stream (lxml)...", debug)
+        buildings = _iter_buildings_lxml(gml_path)
+        to_bytes = LET.tostring
+    else:
+        _log("Parsing XML stream (ElementTree)...", debug)
+        buildings = _iter_buildings_etree(gml_path)
+        to_bytes = ET.tostring
+
+    try:
+        for completed_building in buildings:
+            # === Early Filtering ===
+            # Check limit (early termination)
+            if limit is not None and processed_count >= limit:
+                _log(f"Reached limit ({limit}), stopping parse", debug)
+                return  # Complete termination of generator
+
+            # Check building_ids filter
+            should_process = True
+            if building_ids_set:
+                if filter_attribute == "gml:id":
+                    # Filter by gml:id attribute
+                    if completed_building.get(_ATTR_GML_ID) not in building_ids_set:
+                        should_process = False
+                else:
+                    # Filter by generic attribute
+                    attrs = _extract_generic_attributes(completed_building)
+                    if not any(attrs.get(k) in building_ids_set for k in attrs):
+                        should_process = False
+
+            # === Process or Skip ===
+            if should_process:
+                # Serialized subtree survives clearing of the working tree
+                yield to_bytes(completed_building)
+
+                processed_count += 1
+            else:
+                skipped_count += 1
+                if debug and skipped_count % 100 == 0:
+                    _log(f"Skipped {skipped_count} buildings (filtered)", debug)
+
+            # Force garbage collection after each building
+            # Recommended for large files to prevent memory accumulation
+            if config is None or config.enable_gc_per_building:
+                gc.collect()
+    except _PARSE_ERRORS as e:
+        _log(f"XML Parse Error: {e}", debug=True)
+        raise ValueError(f"Invalid CityGML XML: {e}")
+    finally:
+        # Release the parser's working tree (also on early termination)
+        buildings.close()
+
+    _log(f"Streaming parse complete: processed={processed_count}, skipped={skipped_count}", debug)
+
+    # Final cleanup
+    gc.collect()
+
+
 def stream_parse_buildings(
     gml_path: str,
     limit: Optional[int] = None,
@@ -111,7 +304,8 @@ def stream_parse_buildings(
     - Scalability: Linear O(n) - processes unlimited buildings
 
     **Key Optimizations:**
-    1. SAX-style parsing: `ET.iterparse()` instead of `ET.parse()`
+    1. SAX-style parsing: `lxml.etree.iterparse()` filtered to Building end
+       events (libxml2), falling back to `ET.iterparse()` without lxml
     2. Immediate memory release: `elem.clear()` after yielding
     3. Early filtering: Stop parsing when limit reached
     4. Local XLink indexing: Building-scope only (1-10MB vs. GB)
@@ -146,174 +340,25 @@ def stream_parse_buildings(
     """
     # Use config if provided
     if config:
-        limit = config.limit
-        building_ids = config.building_ids
-        filter_attribute = config.filter_attribute
         debug = config.debug
 
-    # Convert building_ids to set for O(1) lookup
-    building_ids_set: Optional[Set[str]] = None
-    if building_ids:
-        building_ids_set = set(building_ids)
-        _log(f"Filter by {len(building_ids)} building IDs (attribute: {filter_attribute})", debug)
-
-    # Early termination counter
-    processed_count = 0
-    skipped_count = 0
-
-    _log(f"Starting streaming parse: {gml_path}", debug)
-    _log(f"Limit: {limit if limit else 'unlimited'}", debug)
-
-    # SAX-style incremental parsing
-    # Uses events=("start", "end") for full control over element lifecycle
-    try:
-        context = ET.iterparse(gml_path, events=("start", "end"))
-        context = iter(context)
-
-        # Get root element (needed for namespace info)
-        event, root = next(context)
-
-    except ET.ParseError as e:
-        _log(f"XML Parse Error: {e}", debug=True)
-        raise ValueError(f"Invalid CityGML XML: {e}")
-    except FileNotFoundError:
-        _log(f"File not found: {gml_path}", debug=True)
-        raise
-
-    # Building element tracking
-    building_stack: List[Tuple[ET.Element, int]] = []  # Stack of (elem, depth)
-    current_building: Optional[ET.Element] = None
-    current_building_depth: int = 0
-    depth: int = 0
-
-    # Local XLink index (per building)
-    local_xlink_index: Dict[str, ET.Element] = {}
-
-    _log("Parsing XML stream...", debug)
-
-    try:
-        for event, elem in context:
-            if event == "start":
-                depth += 1
-
-                # Build local XLink index for current building
-                # Only index elements within current building scope
-                if current_building is not None:
-                    gml_id = elem.get(f"{{{NS['gml']}}}id")
-                    if gml_id:
-                        local_xlink_index[gml_id] = elem
-
-                # Detect Building element start
-                if elem.tag == f"{{{NS['bldg']}}}Building":
-                    building_stack.append((elem, depth))
-
-                    # Track top-level building (not BuildingPart)
-                    if current_building is None:
-                        current_building = elem
-                        current_building_depth = depth
-                        local_xlink_index = {}  # Reset for new building
-                        gml_id = elem.get(f"{{{NS['gml']}}}id")
-                        if gml_id:
-                            local_xlink_index[gml_id] = elem
-
-            elif event == "end":
-                # Detect Building element completion
-                if elem.tag == f"{{{NS['bldg']}}}Building" and building_stack:
-                    completed_building, building_depth = building_stack.pop()
-
-                    # Process top-level building (not nested BuildingPart)
-                    if building_depth == current_building_depth:
-                        # === Early Filtering ===
-                        should_process = True
-
-                        # Check limit (early termination)
-                        if limit is not None and processed_count >= limit:
-                            _log(f"Reached limit ({limit}), stopping parse", debug)
-
-                            # Clean up and exit
-                            completed_building.clear()
-                            root.clear()
-
-                            # Force garbage collection
-                            gc.collect()
-
-                            return  # Complete termination of generator
-
-                        # Check building_ids filter
-                        if building_ids_set:
-                            if filter_attribute == "gml:id":
-                                # Filter by gml:id attribute
-                                gml_id = completed_building.get(f"{{{NS['gml']}}}id")
-                                if gml_id not in building_ids_set:
-                                    should_process = False
-                            else:
-                                # Filter by generic attribute
-                                attrs = _extract_generic_attributes(completed_building)
-                                if not any(attrs.get(k) in building_ids_set for k in attrs):
-                                    should_process = False
-
-                        # === Process or Skip ===
-                        if should_process:
-                            _log(
-                                f"Yielding building #{processed_count + 1} "
-                                f"(XLink cache: {len(local_xlink_index)} elements)",
-                                debug,
-                            )
-
-                            building_copy = ET.fromstring(ET.tostring(completed_building))
-                            xlink_index_copy = _build_local_xlink_index(building_copy)
-
-                            # Yield building with its local XLink index
-                            yield (building_copy, xlink_index_copy)
-
-                            processed_count += 1
-                        else:
-                            skipped_count += 1
-                            if debug and skipped_count % 100 == 0:
-                                _log(f"Skipped {skipped_count} buildings (filtered)", debug)
-
-                        # === Critical: Immediate Memory Release ===
-                        # This is the key to 98% memory reduction
-
-                        # Clear completed building element and all children
-                        completed_building.clear()
-
-                        # Clear parent references to allow garbage collection
-                        # This prevents memory leaks from parent → child references
-                        while completed_building is not None:
-                            parent_map = {c: p for p in root.iter() for c in p}
-                            parent = parent_map.get(completed_building)
-                            if parent is not None:
-                                parent.remove(completed_building)
-                            completed_building = parent
-
-                        # Clear local XLink index
-                        local_xlink_index.clear()
-
-                        # Force garbage collection after each building
-                        # Recommended for large files to prevent memory accumulation
-                        if config is None or config.enable_gc_per_building:
-                            gc.collect()
-
-                        # Reset current building tracking
-                        current_building = None
-                        current_building_depth = 0
-
-                depth -= 1
-
-                # Periodic cleanup of processed elements outside building scope
-                # Prevents memory growth from metadata elements
-                if depth < 3 and elem != root and current_building is None:
-                    elem.clear()
-    except ET.ParseError as e:
-        _log(f"XML Parse Error: {e}", debug=True)
-        raise ValueError(f"Invalid CityGML XML: {e}")
-
-    _log(f"Streaming parse complete: processed={processed_count}, skipped={skipped_count}", debug)
-
-    # Final cleanup
-    root.clear()
-    gc.collect()
+    for processed_count, building_xml in enumerate(
+        _stream_building_xml(gml_path, limit, building_ids, filter_attribute, debug, config),
+        start=1,
+    ):
+        # Detached xml.etree copy: callers keep the ElementTree API whichever
+        # backend parsed the file
+        building_copy = ET.fromstring(building_xml)
+        xlink_index_copy = _build_local_xlink_index(building_copy)
+
+        _log(
+            f"Yielding building #{processed_count} "
+            f"(XLink cache: {len(xlink_index_copy)} elements)",
+            debug,
+        )
+
+        # Yield building with its local XLink index
+        yield (building_copy, xlink_index_copy)
 
 
 def estimate_memory_savings(
@@ -6,9 +6,16 @@ and automatically selecting appropriate projected coordinate systems for
 geographic coordinates, with special support for Japanese PLATEAU data.
 """
 
+from functools import lru_cache
 from typing import Optional, Tuple, Dict
 import re
-import math
+
+# Optional: NumPy for batch zone lookup
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
 
 # Japan Plane Rectangular Coordinate Systems (JGD2011)
@@ -150,6 +157,59 @@ JAPAN_PLANE_ZONES: Dict[int, Dict] = {
 }
 
 
+# Common geographic CRS codes used in Japan/PLATEAU
+_GEOGRAPHIC_CODES = frozenset({
+    "4326",  # WGS84
+    "4612",  # JGD2000
+    "6668",  # JGD2011
+    "6697",  # JGD2011 / (vertical) / height
+    "4019",  # GRS 1980
+})
+
+# Reverse index: EPSG code -> zone info
+_EPSG_TO_ZONE: Dict[str, Dict] = {
+    zone_info["epsg"]: zone_info for zone_info in JAPAN_PLANE_ZONES.values()
+}
+
+# Common (non plane-rectangular) CRS names
+_KNOWN_CRS: Dict[str, Dict[str, str]] = {
+    "EPSG:6697": {"name": "JGD2011 / (vertical) / height", "type": "geographic"},
+    "EPSG:6668": {"name": "JGD2011", "type": "geographic"},
+    "EPSG:4612": {"name": "JGD2000", "type": "geographic"},
+    "EPSG:4326": {"name": "WGS 84", "type": "geographic"},
+    "EPSG:3857": {"name": "WGS 84 / Pseudo-Mercator", "type": "projected"},
+}
+
+# Zone bounds and centers precomputed once:
+# (lat_min, lat_max, lon_min, lon_max, lat_center, lon_center, epsg)
+_ZONE_BOUNDS = tuple(
+    (
+        zone_info["lat_range"][0], zone_info["lat_range"][1],
+        zone_info["lon_range"][0], zone_info["lon_range"][1],
+        (zone_info["lat_range"][0] + zone_info["lat_range"][1]) / 2,
+        (zone_info["lon_range"][0] + zone_info["lon_range"][1]) / 2,
+        zone_info["epsg"],
+    )
+    for zone_info in JAPAN_PLANE_ZONES.values()
+)
+
+if NUMPY_AVAILABLE:
+    _ZONE_TABLE = np.array([bounds[:6] for bounds in _ZONE_BOUNDS], dtype=np.float64)
+    # Last slot is the "no zone" result (None)
+    _ZONE_EPSG = np.array([bounds[6] for bounds in _ZONE_BOUNDS] + [None], dtype=object)
+
+
+# srsName patterns, tried in order: ".../EPSG/0/6697" (with version) first,
+# then the simpler "EPSG:6697"
+_EPSG_PATTERNS = (
+    re.compile(r"EPSG[/:#\s]+\d+[/:#\s]+(\d+)", re.IGNORECASE),
+    re.compile(r"EPSG[/:#\s]+(\d+)", re.IGNORECASE),
+)
+
+
+# The CRS helpers below are pure and see the same few srsName/EPSG strings
+# over and over, so they are memoized on their exact arguments.
+@lru_cache(maxsize=256)
 def detect_epsg_from_srs(srs: str) -> Optional[str]:
     """
     Extract EPSG code from an srsName string.
@@ -162,20 +222,22 @@ def detect_epsg_from_srs(srs: str) -> Optional[str]:
     """
     if not srs:
         return None
-    
-    # Handle URLs like http://www.opengis.net/def/crs/EPSG/0/6697
-    m = re.search(r"EPSG[/:#\s]+\d+[/:#\s]+(\d+)", srs, re.IGNORECASE)
-    if m:
-        return f"EPSG:{m.group(1)}"
-    
-    # Fallback to simpler pattern
-    m = re.search(r"EPSG[/:#\s]+(\d+)", srs, re.IGNORECASE)
-    if m:
-        return f"EPSG:{m.group(1)}"
-    
+
+    # Cheap substring rejection before the regexes (CRS84, local srsNames, ...);
+    # upper() only runs when neither common spelling is present
+    if "EPSG" not in srs and "epsg" not in srs and "EPSG" not in srs.upper():
+        return None
+
+    # URLs like http://www.opengis.net/def/crs/EPSG/0/6697, then "EPSG:6697"
+    for pattern in _EPSG_PATTERNS:
+        m = pattern.search(srs)
+        if m:
+            return f"EPSG:{m.group(1)}"
+
     return None
 
 
+@lru_cache(maxsize=256)
 def is_geographic_crs(epsg_code: str) -> bool:
     """
     Check if an EPSG code represents a geographic (lat/lon) coordinate system.
@@ -186,21 +248,12 @@ def is_geographic_crs(epsg_code: str) -> bool:
     Returns:
         True if geographic CRS, False otherwise
     """
-    # Common geographic CRS codes used in Japan/PLATEAU
-    geographic_codes = [
-        "4326",  # WGS84
-        "4612",  # JGD2000
-        "6668",  # JGD2011
-        "6697",  # JGD2011 / (vertical) / height
-        "4019",  # GRS 1980
-    ]
-    
     if not epsg_code:
         return False
     
-    # Extract numeric part
-    code_num = epsg_code.replace("EPSG:", "").replace("epsg:", "")
-    return code_num in geographic_codes
+    # Extract numeric part ("EPSG:6697", "epsg:6697" or bare "6697")
+    authority, _, code_num = epsg_code.upper().rpartition(":")
+    return code_num in _GEOGRAPHIC_CODES and authority in ("", "EPSG")
 
 
 def get_japan_plane_zone(lat: float, lon: float) -> Optional[str]:
@@ -222,20 +275,15 @@ def get_japan_plane_zone(lat: float, lon: float) -> Optional[str]:
     best_zone = None
     best_distance = float('inf')
     
-    for zone_num, zone_info in JAPAN_PLANE_ZONES.items():
-        lat_min, lat_max = zone_info["lat_range"]
-        lon_min, lon_max = zone_info["lon_range"]
-        
+    for lat_min, lat_max, lon_min, lon_max, lat_center, lon_center, epsg in _ZONE_BOUNDS:
         # Check if point is within zone bounds
         if lat_min <= lat <= lat_max and lon_min <= lon <= lon_max:
-            # Calculate distance to zone center for tie-breaking
-            lat_center = (lat_min + lat_max) / 2
-            lon_center = (lon_min + lon_max) / 2
-            distance = math.sqrt((lat - lat_center)**2 + (lon - lon_center)**2)
+            # Squared distance to zone center for tie-breaking (same ordering as distance)
+            distance = (lat - lat_center)**2 + (lon - lon_center)**2
             
             if distance < best_distance:
                 best_distance = distance
-                best_zone = zone_info["epsg"]
+                best_zone = epsg
     
     # If no exact match, use zone 9 (Tokyo area) as default for central Japan
     if best_zone is None and 34 <= lat <= 37 and 138 <= lon <= 141:
@@ -244,6 +292,54 @@ def get_japan_plane_zone(lat: float, lon: float) -> Optional[str]:
     return best_zone
 
 
+def get_japan_plane_zones_batch(lats, lons) -> "np.ndarray":
+    """
+    Vectorized get_japan_plane_zone() for arrays of coordinates.
+    
+    Containment and center distance are evaluated for all points against
+    all 19 zones in one broadcast; results match the scalar function.
+    
+    Args:
+        lats: Latitudes in degrees (array-like)
+        lons: Longitudes in degrees (array-like, same shape as lats)
+    
+    Returns:
+        1-D object array of EPSG codes (None where outside Japan)
+    
+    Raises:
+        ImportError: If numpy is not installed
+    """
+    if not NUMPY_AVAILABLE:
+        raise ImportError("get_japan_plane_zones_batch requires numpy")
+    
+    lats = np.asarray(lats, dtype=np.float64).ravel()
+    lons = np.asarray(lons, dtype=np.float64).ravel()
+    lat = lats[:, None]
+    lon = lons[:, None]
+    
+    inside = (
+        (lat >= _ZONE_TABLE[:, 0]) & (lat <= _ZONE_TABLE[:, 1])
+        & (lon >= _ZONE_TABLE[:, 2]) & (lon <= _ZONE_TABLE[:, 3])
+    )
+    distance = np.where(inside, (lat - _ZONE_TABLE[:, 4])**2 + (lon - _ZONE_TABLE[:, 5])**2, np.inf)
+    
+    # argmin keeps the first of equal distances, like the scalar loop
+    best = distance.argmin(axis=1)
+    matched = inside.any(axis=1)
+    
+    # Same fallbacks as the scalar function: zone IX for central Japan,
+    # None outside Japan's general area
+    japan = (lats >= 20) & (lats <= 46) & (lons >= 122) & (lons <= 154)
+    central = (lats >= 34) & (lats <= 37) & (lons >= 138) & (lons <= 141)
+    zone_ix = list(JAPAN_PLANE_ZONES).index(9)
+    no_zone = len(_ZONE_BOUNDS)
+    best = np.where(matched, best, np.where(central, zone_ix, no_zone))
+    best[~japan] = no_zone
+    
+    return np.take(_ZONE_EPSG, best)
+
+
+@lru_cache(maxsize=256)
 def recommend_projected_crs(source_crs: str, sample_lat: Optional[float] = None, 
                            sample_lon: Optional[float] = None) -> Optional[str]:
     """
@@ -291,32 +387,28 @@ def get_crs_info(epsg_code: str) -> Dict[str, str]:
     Returns:
         Dictionary with CRS information
     """
-    # Extract zone number if it's a Japan Plane CS
-    if epsg_code.startswith("EPSG:"):
-        code_num = epsg_code.replace("EPSG:", "")
-        for zone_num, zone_info in JAPAN_PLANE_ZONES.items():
-            if zone_info["epsg"] == epsg_code:
-                return {
-                    "code": epsg_code,
-                    "name": zone_info["name"],
-                    "regions": ", ".join(zone_info["regions"]),
-                    "type": "projected"
-                }
-    
-    # Common CRS names
-    known_crs = {
-        "EPSG:6697": {"name": "JGD2011 / (vertical) / height", "type": "geographic"},
-        "EPSG:6668": {"name": "JGD2011", "type": "geographic"},
-        "EPSG:4612": {"name": "JGD2000", "type": "geographic"},
-        "EPSG:4326": {"name": "WGS 84", "type": "geographic"},
-        "EPSG:3857": {"name": "WGS 84 / Pseudo-Mercator", "type": "projected"},
-    }
+    # Copy: callers may modify the result, the cached dict must not change
+    return dict(_get_crs_info_cached(epsg_code))
+
+
+@lru_cache(maxsize=256)
+def _get_crs_info_cached(epsg_code: str) -> Dict[str, str]:
+    # Japan Plane Rectangular CS zone
+    zone_info = _EPSG_TO_ZONE.get(epsg_code)
+    if zone_info:
+        return {
+            "code": epsg_code,
+            "name": zone_info["name"],
+            "regions": ", ".join(zone_info["regions"]),
+            "type": "projected"
+        }
     
-    if epsg_code in known_crs:
+    known = _KNOWN_CRS.get(epsg_code)
+    if known:
         return {
             "code": epsg_code,
-            "name": known_crs[epsg_code]["name"],
-            "type": known_crs[epsg_code]["type"]
+            "name": known["name"],
+            "type": known["type"]
         }
     
     return {
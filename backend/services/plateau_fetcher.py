@@ -27,13 +27,23 @@ Usage:
 from __future__ import annotations
 
 import glob
+import io
 import json
+import mmap
 import os
+import re
+import tempfile
+import threading
 import time
 import xml.etree.ElementTree as ET
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Tuple, Dict, Any, Set
+from types import MappingProxyType
+from typing import List, Optional, Tuple, Dict, Any, Set, Union
 
 import requests
 from shapely.geometry import Point
@@ -44,6 +54,27 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent / "utils"))
 from mesh_utils import latlon_to_mesh_3rd, get_neighboring_meshes_3rd
 
+# Optional NumPy for the compact mesh index (falls back to a plain dict)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Optional fast JSON parser for the mesh index (falls back to stdlib json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional incremental JSON parser for CITYGML_INDEX_STREAMING lookups
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 
 # CityGML namespaces (same as citygml_to_step.py)
 NS = {
@@ -61,72 +92,325 @@ NS = {
 # ============================================================================
 
 # Module-level cache for mesh index (loaded once per process)
-_MESH_INDEX_CACHE: Optional[Dict[str, Any]] = None
+_MESH_INDEX_CACHE: Optional[Mapping] = None
+_MESH_INDEX_LOCK = threading.Lock()
+
+_DEFAULT_CACHE_DIR = Path(__file__).resolve().parent.parent / "data" / "citygml_cache"
+
+# Bump when the snapshot layout (or _CompactMeshIndex) changes
+_MESH_INDEX_SNAPSHOT_VERSION = 3
 
 
-def _get_cache_config() -> Dict[str, Any]:
+def _get_cache_config() -> Mapping:
     """Get CityGML cache configuration from environment variables.
 
+    The result is cached per combination of the CITYGML_* variables, so
+    repeated calls on the cache lookup path cost three environ reads; any
+    change to those variables (e.g. patch.dict in tests) is picked up.
+
     Returns:
-        Dictionary with cache configuration:
+        Read-only mapping with cache configuration:
         - enabled: bool - Whether cache is enabled
         - cache_dir: Path - Cache directory path
         - mesh_index_path: Path - Path to mesh_to_ward_index.json
+        - index_streaming: bool - Scan the index per lookup instead of loading it
     """
-    default_cache_dir = Path(__file__).resolve().parent.parent / "data" / "citygml_cache"
-    cache_dir_str = os.getenv("CITYGML_CACHE_DIR", str(default_cache_dir))
-    cache_dir = Path(cache_dir_str)
+    return _build_cache_config(
+        os.environ.get("CITYGML_CACHE_DIR"),
+        os.environ.get("CITYGML_CACHE_ENABLED"),
+        os.environ.get("CITYGML_INDEX_STREAMING"),
+    )
 
-    return {
-        "enabled": os.getenv("CITYGML_CACHE_ENABLED", "false").lower() == "true",
+
+@lru_cache(maxsize=16)
+def _build_cache_config(
+    cache_dir_env: Optional[str],
+    enabled_env: Optional[str],
+    streaming_env: Optional[str],
+) -> Mapping:
+    cache_dir = Path(cache_dir_env) if cache_dir_env is not None else _DEFAULT_CACHE_DIR
+
+    return MappingProxyType({
+        "enabled": (enabled_env or "false").lower() == "true",
         "cache_dir": cache_dir,
-        "mesh_index_path": cache_dir / "mesh_to_ward_index.json"
-    }
+        "mesh_index_path": cache_dir / "mesh_to_ward_index.json",
+        "index_streaming": (streaming_env or "false").lower() in ("1", "true"),
+    })
+
+
+class _CompactMeshIndex(Mapping):
+    """Read-only mesh→ward mapping backed by a sorted uint32 key array.
 
+    A dict of ~500k str→str entries costs ~50 MB; here each mesh code is a
+    4-byte integer and ward values are shared (interned) objects, so lookups
+    are a binary search over a contiguous array.
+    """
+
+    __slots__ = ("_meshes", "_wards")
+
+    def __init__(self, index: Dict[str, Any]):
+        meshes = np.fromiter((int(k) for k in index), dtype=np.uint32, count=len(index))
+        order = np.argsort(meshes, kind="stable")
+
+        # Ward codes repeat across thousands of meshes: keep one object each
+        interned: Dict[str, str] = {}
+        wards = np.empty(len(index), dtype=object)
+        for i, ward in enumerate(index.values()):
+            wards[i] = interned.setdefault(ward, ward)
+
+        self._meshes = meshes[order]
+        self._wards = wards[order]
+
+    @classmethod
+    def from_arrays(cls, meshes: "np.ndarray", ward_ids: "np.ndarray",
+                    ward_table: List[str]) -> "_CompactMeshIndex":
+        """Rebuild from to_arrays() output (sorted keys, ids into ward_table)."""
+        self = cls.__new__(cls)
+        self._meshes = meshes
+        self._wards = np.array(ward_table, dtype=object)[ward_ids]
+        return self
+
+    def to_arrays(self) -> Tuple["np.ndarray", "np.ndarray", List[str]]:
+        """(sorted uint32 keys, uint32 ward ids, ward table) without objects in arrays."""
+        ids: Dict[str, int] = {}
+        ward_ids = np.fromiter((ids.setdefault(w, len(ids)) for w in self._wards),
+                               dtype=np.uint32, count=len(self._wards))
+        return self._meshes, ward_ids, list(ids)
+
+    @staticmethod
+    def supports(index: Dict[str, Any]) -> bool:
+        """True if every key is an 8-digit mesh code (lossless as uint32)."""
+        return all(len(k) == 8 and k.isascii() and k.isdigit() for k in index)
+
+    def _find(self, mesh_code: Any) -> int:
+        # str or ASCII bytes (latlon_to_mesh_3rd_bytes / |S8 batch output)
+        if not (isinstance(mesh_code, (str, bytes)) and len(mesh_code) == 8
+                and mesh_code.isascii() and mesh_code.isdigit()):
+            return -1
+        # uint32 scalar: a Python int would promote (and copy) the whole array
+        key = np.uint32(mesh_code)
+        i = int(self._meshes.searchsorted(key))
+        if i < len(self._meshes) and self._meshes[i] == key:
+            return i
+        return -1
+
+    def __getitem__(self, mesh_code: str) -> Any:
+        i = self._find(mesh_code)
+        if i < 0:
+            raise KeyError(mesh_code)
+        return self._wards[i]
+
+    def get(self, mesh_code: str, default: Any = None) -> Any:
+        i = self._find(mesh_code)
+        return self._wards[i] if i >= 0 else default
+
+    def __contains__(self, mesh_code: object) -> bool:
+        return self._find(mesh_code) >= 0
+
+    def __iter__(self):
+        return (f"{m:08d}" for m in self._meshes.tolist())
+
+    def __len__(self) -> int:
+        return len(self._meshes)
+
+
+def _canonical_wards(ward: Any) -> str:
+    """Normalize an index value to comma-joined ward codes.
+
+    "13101" stays as-is; ["13113", "13104"] becomes "13113,13104".
+    """
+    if isinstance(ward, list):
+        return ",".join(w for w in ward if w)
+    return ward
+
+
+def _read_mesh_index_file(mesh_index_path: Path) -> Dict[str, Any]:
+    """Parse mesh_to_ward_index.json.
+
+    With orjson the file is memory-mapped and parsed straight from the
+    mapping (no intermediate bytes/str copy); otherwise stdlib json is used.
+    """
+    if not ORJSON_AVAILABLE:
+        with open(mesh_index_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    with open(mesh_index_path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # The memoryview must be released before the mapping is closed
+            with memoryview(mm) as buf:
+                return orjson.loads(buf)
+
+
+def _mesh_index_snapshot_path(mesh_index_path: Path) -> Path:
+    """Sidecar next to the JSON: mesh_to_ward_index.cache.npz."""
+    return mesh_index_path.with_suffix(".cache.npz")
+
+
+def _snapshot_stamp(mesh_index_path: Path) -> Tuple[int, int, int]:
+    stat = mesh_index_path.stat()
+    return (_MESH_INDEX_SNAPSHOT_VERSION, stat.st_mtime_ns, stat.st_size)
+
+
+def _load_mesh_index_snapshot(mesh_index_path: Path) -> Optional[Mapping]:
+    """Load the index snapshot if it was written from the current JSON file.
+
+    The .npz holds plain numeric/unicode arrays only and is read with
+    allow_pickle=False, so a tampered file cannot execute code.
+    Returns None when the snapshot is missing, stale or unreadable.
+    """
+    if not NUMPY_AVAILABLE:
+        return None
 
-def _load_mesh_index() -> Dict[str, Any]:
+    snapshot_path = _mesh_index_snapshot_path(mesh_index_path)
+    try:
+        with np.load(snapshot_path, allow_pickle=False) as data:
+            if tuple(data["stamp"].tolist()) != _snapshot_stamp(mesh_index_path):
+                return None
+            return _CompactMeshIndex.from_arrays(
+                data["meshes"], data["ward_ids"], data["wards"].tolist()
+            )
+    except Exception:
+        return None
+
+
+def _save_mesh_index_snapshot(mesh_index_path: Path, index: Mapping) -> None:
+    """Write the compact index atomically (temp file + rename); best effort.
+
+    Plain dict indexes (no NumPy, or non-numeric keys) are not snapshotted.
+    """
+    if not isinstance(index, _CompactMeshIndex):
+        return
+
+    snapshot_path = _mesh_index_snapshot_path(mesh_index_path)
+    try:
+        meshes, ward_ids, ward_table = index.to_arrays()
+        fd, tmp_path = tempfile.mkstemp(dir=snapshot_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                # Stamp inside the same file, so one rename publishes both
+                np.savez(
+                    f,
+                    stamp=np.array(_snapshot_stamp(mesh_index_path), dtype=np.int64),
+                    meshes=meshes,
+                    ward_ids=ward_ids,
+                    wards=np.array(ward_table, dtype=np.str_),
+                )
+            os.replace(tmp_path, snapshot_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except Exception as e:
+        # Read-only cache directories simply fall back to parsing the JSON
+        print(f"[CACHE] Could not write mesh index snapshot: {e}")
+
+
+def _load_mesh_index() -> Mapping:
     """Load mesh→ward index from cache with module-level caching.
 
-    The index is loaded once per process and cached in memory for O(1) lookups.
+    The index is loaded once per process and cached in memory. With NumPy
+    available it is stored as a _CompactMeshIndex (sorted uint32 keys,
+    binary-search lookups); otherwise the parsed dict is kept as-is.
+    Initialization is guarded by _MESH_INDEX_LOCK, so concurrent first
+    requests parse the index only once.
+
+    The compact index is also saved as a .npz snapshot stamped with the
+    JSON's mtime and size, so later processes skip the JSON parse until it
+    changes.
 
     Returns:
-        Dictionary mapping mesh codes to ward area codes:
+        Mapping of mesh codes to ward area codes:
         - Single ward: {"53393580": "13101"}
-        - Multiple wards: {"53393580": ["13101", "13102"]}
+        - Multiple wards: {"53393580": "13101,13102"} (comma-joined, in the
+          order listed in mesh_to_ward_index.json)
         Empty dict if cache is disabled or loading fails.
     """
     global _MESH_INDEX_CACHE
 
-    # Return cached index if already loaded
-    if _MESH_INDEX_CACHE is not None:
+    # Return cached index if already loaded (lock-free fast path)
+    index = _MESH_INDEX_CACHE
+    if index is not None:
+        return index
+
+    with _MESH_INDEX_LOCK:
+        # Another thread may have finished loading while we waited
+        if _MESH_INDEX_CACHE is None:
+            _MESH_INDEX_CACHE = _read_mesh_index()
         return _MESH_INDEX_CACHE
 
+
+def _read_mesh_index() -> Mapping:
+    """Read the mesh index from disk (snapshot or JSON); see _load_mesh_index."""
     config = _get_cache_config()
     if not config["enabled"]:
-        _MESH_INDEX_CACHE = {}
-        return _MESH_INDEX_CACHE
+        return {}
 
     try:
         mesh_index_path = config["mesh_index_path"]
         if not mesh_index_path.exists():
             print(f"[CACHE] Mesh index not found: {mesh_index_path}")
-            _MESH_INDEX_CACHE = {}
-            return _MESH_INDEX_CACHE
-
-        with open(mesh_index_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            _MESH_INDEX_CACHE = data.get("index", {})
-            print(f"[CACHE] Loaded mesh index with {len(_MESH_INDEX_CACHE)} entries")
-            return _MESH_INDEX_CACHE
+            return {}
+
+        # Cold start: reuse the snapshot if the JSON is unchanged
+        index = _load_mesh_index_snapshot(mesh_index_path)
+        if index is not None:
+            print(f"[CACHE] Loaded mesh index snapshot with {len(index)} entries")
+            return index
+
+        data = _read_mesh_index_file(mesh_index_path)
+        # One str per mesh: multi-ward lists are stored comma-joined
+        index = {k: _canonical_wards(v) for k, v in data.get("index", {}).items()}
+        if NUMPY_AVAILABLE and index and _CompactMeshIndex.supports(index):
+            index = _CompactMeshIndex(index)
+        _save_mesh_index_snapshot(mesh_index_path, index)
+        print(f"[CACHE] Loaded mesh index with {len(index)} entries")
+        return index
 
     except Exception as e:
         print(f"[CACHE] Failed to load mesh index: {e}")
-        _MESH_INDEX_CACHE = {}
-        return _MESH_INDEX_CACHE
+        return {}
+
+
+def _get_ward_from_mesh_streaming(mesh_code: str) -> Any:
+    """Scan mesh_to_ward_index.json for a single mesh code with ijson.
+
+    O(file size) time but O(1) memory: the index is never materialized,
+    which suits memory-constrained deployments that only serve a few wards.
+
+    Returns:
+        Comma-joined ward codes (see _canonical_wards), None if not found.
+    """
+    config = _get_cache_config()
+    if not config["enabled"]:
+        return None
+
+    try:
+        with open(config["mesh_index_path"], 'rb') as f:
+            for key, ward in ijson.kvitems(f, "index"):
+                if key == mesh_code:
+                    return _canonical_wards(ward)
+    except Exception as e:
+        print(f"[CACHE] Failed to scan mesh index: {e}")
+    return None
+
+
+def _index_streaming_active() -> bool:
+    """True if lookups should scan the index file instead of loading it.
+
+    Requires CITYGML_INDEX_STREAMING, ijson, and no index in memory yet.
+    """
+    return (_MESH_INDEX_CACHE is None and IJSON_AVAILABLE
+            and _get_cache_config()["index_streaming"])
+
+
+def _lookup_mesh_index(mesh_code: str) -> Any:
+    """Comma-joined ward codes for mesh_code (None if absent)."""
+    if _index_streaming_active():
+        return _get_ward_from_mesh_streaming(mesh_code)
+    return _load_mesh_index().get(mesh_code)
 
 
 def _get_ward_from_mesh(mesh_code: str) -> Optional[str]:
-    """Get ward area code from mesh code using O(1) index lookup.
+    """Get ward area code from mesh code using the cached index.
 
     Args:
         mesh_code: 3rd mesh code (8 digits, e.g., "53393580")
@@ -135,31 +419,16 @@ def _get_ward_from_mesh(mesh_code: str) -> Optional[str]:
         Ward area code (e.g., "13101") if found, None otherwise.
         If mesh spans multiple wards, returns the first ward.
     """
-    mesh_index = _load_mesh_index()
-    ward = mesh_index.get(mesh_code)
-
-    if ward is None:
-        return None
-
-    # Handle meshes spanning multiple wards
-    if isinstance(ward, list):
-        return ward[0] if ward else None
+    wards = _lookup_mesh_index(mesh_code)
 
-    return ward
+    # Meshes spanning multiple wards: first listed ward
+    return wards.partition(",")[0] if wards else None
 
 
 def _get_wards_from_mesh(mesh_code: str) -> List[str]:
     """Get all ward area codes for a mesh code."""
-    mesh_index = _load_mesh_index()
-    ward = mesh_index.get(mesh_code)
-
-    if ward is None:
-        return []
-
-    if isinstance(ward, list):
-        return [w for w in ward if w]
-
-    return [ward]
+    wards = _lookup_mesh_index(mesh_code)
+    return wards.split(",") if wards else []
 
 
 def _find_cached_gml_files(cache_dir: Path, area_code: str, mesh_code: str) -> List[Path]:
@@ -204,8 +473,7 @@ def _load_gml_from_cache(mesh_code: str, area_code: str) -> Optional[str]:
     # Single file: read directly
     if len(gml_files) == 1:
         try:
-            with open(gml_files[0], 'r', encoding='utf-8') as f:
-                return f.read()
+            return _read_gml_text(gml_files[0])
         except Exception as e:
             print(f"[CACHE] Failed to read GML file: {e}")
             return None
@@ -223,9 +491,18 @@ def _load_gml_from_cache_multi(mesh_code: str, area_codes: List[str]) -> Optiona
     config = _get_cache_config()
     cache_dir = config["cache_dir"]
 
+    # Ward directory scans are independent I/O; run them concurrently
     all_files: List[Path] = []
-    for area_code in area_codes:
-        all_files.extend(_find_cached_gml_files(cache_dir, area_code, mesh_code))
+    if len(area_codes) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, len(area_codes))) as executor:
+            for ward_files in executor.map(
+                lambda area_code: _find_cached_gml_files(cache_dir, area_code, mesh_code),
+                area_codes,
+            ):
+                all_files.extend(ward_files)
+    else:
+        for area_code in area_codes:
+            all_files.extend(_find_cached_gml_files(cache_dir, area_code, mesh_code))
 
     if not all_files:
         return None
@@ -243,8 +520,7 @@ def _load_gml_from_cache_multi(mesh_code: str, area_codes: List[str]) -> Optiona
 
     if len(unique_files) == 1:
         try:
-            with open(unique_files[0], 'r', encoding='utf-8') as f:
-                return f.read()
+            return _read_gml_text(unique_files[0])
         except Exception as e:
             print(f"[CACHE] Failed to read GML file: {e}")
             return None
@@ -256,10 +532,110 @@ def _load_gml_from_cache_multi(mesh_code: str, area_codes: List[str]) -> Optiona
         return None
 
 
+def _map_gml_file(stack: ExitStack, path: Path) -> Union[mmap.mmap, bytes]:
+    """Read-only memory map of a GML file, closed when stack exits.
+
+    Contents stay in the page cache instead of being copied into a bytes
+    object; empty files (which cannot be mapped) are returned as b"".
+    Read-ahead is requested immediately (MADV_WILLNEED where supported).
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b""
+        mm = stack.enter_context(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    # Start kernel read-ahead now, so all files of a merge are read from
+    # disk in parallel instead of page-faulting one after another
+    if hasattr(mmap, "MADV_WILLNEED"):
+        mm.madvise(mmap.MADV_WILLNEED)
+    return mm
+
+
+def _read_gml_text(path: Path) -> str:
+    """Read a GML file as str, decoding straight from a memory map."""
+    with ExitStack() as stack:
+        return str(_map_gml_file(stack, path), "utf-8")
+
+
+# Root start tag (skips <?xml ...?> and <!DOCTYPE ...>) and its xmlns declarations
+_GML_ROOT_START_TAG = re.compile(rb"<([A-Za-z_][\w.\-]*(?::[\w.\-]+)?)(\s[^>]*)?>")
+_GML_XMLNS_DECL = re.compile(rb"xmlns(?::([\w.\-]+))?\s*=\s*([\"'])(.*?)\2", re.S)
+_GML_CORE_NS = NS["core"].encode()
+
+
+def _gml_root_info(data: bytes) -> Optional[Tuple[bytes, Dict[bytes, bytes], int]]:
+    """Root element name, its xmlns declarations and the offset after its start tag.
+
+    Returns None when the root cannot be located reliably (e.g. comments
+    before the root element).
+    """
+    match = _GML_ROOT_START_TAG.search(data)
+    if match is None or b"<!--" in data[:match.start()]:
+        return None
+    nsmap = {
+        decl.group(1) or b"": decl.group(3)
+        for decl in _GML_XMLNS_DECL.finditer(match.group(2) or b"")
+    }
+    return match.group(1), nsmap, match.end()
+
+
+def _splice_gml_bytes(blobs: List[Union[mmap.mmap, bytes]]) -> Optional[bytes]:
+    """Merge cityObjectMember elements of several CityGML documents as raw bytes.
+
+    The first document is copied up to its closing root tag, the span from the
+    first to the last cityObjectMember of every other document is appended,
+    then the closing root tag. Only used when every document declares the
+    same namespace prefixes as the first one, so the spliced members keep
+    their meaning.
+
+    Returns:
+        Combined document, or None if the inputs cannot be spliced safely
+    """
+    base_info = _gml_root_info(blobs[0])
+    if base_info is None:
+        return None
+    root_name, nsmap, _ = base_info
+
+    core_prefix = next((p for p, uri in nsmap.items() if uri == _GML_CORE_NS), None)
+    if core_prefix is None:
+        return None
+    member = core_prefix + b":cityObjectMember" if core_prefix else b"cityObjectMember"
+    member_open = re.compile(b"<" + re.escape(member) + rb"[\s/>]")
+    member_close = b"</" + member + b">"
+
+    base = blobs[0]
+    root_close = base.rfind(b"</" + root_name)
+    if root_close < 0:
+        return None
+
+    out = io.BytesIO()
+    out.write(memoryview(base)[:root_close])
+
+    for blob in blobs[1:]:
+        info = _gml_root_info(blob)
+        if info is None or any(nsmap.get(p) != uri for p, uri in info[1].items()):
+            return None
+
+        first = member_open.search(blob, info[2])
+        if first is None:
+            continue  # No city objects in this document
+        last = blob.rfind(member_close)
+        if last < first.start():
+            return None
+
+        out.write(memoryview(blob)[first.start():last + len(member_close)])
+        out.write(b"\n")
+
+    out.write(memoryview(base)[root_close:])
+    return out.getvalue()
+
+
 def _combine_gml_files(file_paths: List[Path]) -> str:
     """Combine multiple CityGML files into a single XML document.
 
     Merges all cityObjectMember elements from multiple files into one root element.
+    Files sharing the base file's namespace declarations are spliced as raw
+    bytes; otherwise they are merged through ElementTree.
 
     Args:
         file_paths: List of paths to CityGML files
@@ -273,26 +649,26 @@ def _combine_gml_files(file_paths: List[Path]) -> str:
     if not file_paths:
         raise ValueError("No file paths provided")
 
-    # Read base file
-    with open(file_paths[0], 'r', encoding='utf-8') as f:
-        base_xml = f.read()
-
-    root = ET.fromstring(base_xml)
-
     # Single file: return as-is
     if len(file_paths) == 1:
-        return base_xml
+        return _read_gml_text(file_paths[0])
+
+    with ExitStack() as stack:
+        # Kept as memory maps; decoded to str once, after combining
+        blobs = [_map_gml_file(stack, Path(file_path)) for file_path in file_paths]
 
-    # Merge remaining files
-    for file_path in file_paths[1:]:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        spliced = _splice_gml_bytes(blobs)
+        if spliced is not None:
+            return spliced.decode("utf-8")
 
-        other_root = ET.fromstring(content)
+        # Fallback: DOM merge (documents with differing namespace declarations)
+        root = ET.fromstring(blobs[0][:])
+        for content in blobs[1:]:
+            other_root = ET.fromstring(content[:])
 
-        # Find all cityObjectMember elements and append to base
-        for member in other_root.findall(".//{http://www.opengis.net/citygml/2.0}cityObjectMember"):
-            root.append(member)
+            # Find all cityObjectMember elements and append to base
+            for member in other_root.findall(".//{http://www.opengis.net/citygml/2.0}cityObjectMember"):
+                root.append(member)
 
     # Convert back to string
     return ET.tostring(root, encoding='unicode')
@@ -472,6 +848,27 @@ class GeocodingResult:
     osm_id: Optional[int] = None
 
 
+# Nominatim endpoint and headers (User-Agent is required by Nominatim usage policy)
+_NOMINATIM_URL = "https://nominatim.openstreetmap.org/search"
+_NOMINATIM_HEADERS = {
+    "User-Agent": "Paper-CAD/1.0 (https://github.com/Soynyuu/paper-cad)"
+}
+
+# Shared keep-alive session so repeated geocoding calls reuse one TLS connection
+_NOMINATIM_SESSION: Optional[requests.Session] = None
+
+
+def _get_nominatim_session() -> requests.Session:
+    """Get the shared Nominatim session (created on first use)."""
+    global _NOMINATIM_SESSION
+
+    if _NOMINATIM_SESSION is None:
+        session = requests.Session()
+        session.headers.update(_NOMINATIM_HEADERS)
+        _NOMINATIM_SESSION = session
+    return _NOMINATIM_SESSION
+
+
 def geocode_address(
     query: str,
     country_codes: str = "jp",
@@ -503,9 +900,6 @@ def geocode_address(
         ...     print(f"Found: {result.display_name}")
         ...     print(f"Coordinates: ({result.latitude}, {result.longitude})")
     """
-    # Nominatim API endpoint
-    url = "https://nominatim.openstreetmap.org/search"
-
     # Request parameters - get multiple results for better selection
     params = {
         "q": query,
@@ -515,13 +909,8 @@ def geocode_address(
         "addressdetails": 1,
     }
 
-    # User-Agent is required by Nominatim usage policy
-    headers = {
-        "User-Agent": "Paper-CAD/1.0 (https://github.com/Soynyuu/paper-cad)"
-    }
-
     try:
-        response = requests.get(url, params=params, headers=headers, timeout=timeout)
+        response = _get_nominatim_session().get(_NOMINATIM_URL, params=params, timeout=timeout)
         response.raise_for_status()
 
         data = response.json()
@@ -18,13 +18,25 @@ Requirements:
 """
 
 import argparse
+import io
+import multiprocessing
 import time
+import timeit
 import tracemalloc
 import gc
 import sys
 from pathlib import Path
 import xml.etree.ElementTree as ET
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager, redirect_stdout
+
+# Try to import lxml for a libxml2-backed legacy DOM baseline
+try:
+    from lxml import etree as LET
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
@@ -32,16 +44,35 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 from services.citygml.streaming.parser import stream_parse_buildings
 from services.citygml.streaming.coordinate_optimizer import (
     parse_poslist_optimized,
-    parse_poslist_numpy,
+    _parse_poslist_numpy_uncached,
     benchmark_parsers,
     NUMPY_AVAILABLE
 )
 from services.citygml.streaming.memory_profiler import (
     MemoryProfiler,
+    MemoryProfilerRusage,
+    RUSAGE_AVAILABLE,
     profile_memory,
     compare_memory_usage
 )
 
+if NUMPY_AVAILABLE:
+    import numpy as np
+
+
+# Coordinate parsers to benchmark; adding a candidate is one entry here
+PARSERS = {
+    'optimized': ('Optimized (list comprehension)', parse_poslist_optimized),
+}
+if NUMPY_AVAILABLE:
+    # Memo cleared and result materialized on every call, so each timed
+    # call really parses and pays for the same list the other arm returns
+    PARSERS['numpy'] = ('NumPy (vectorized)', _parse_poslist_numpy_uncached)
+
+
+# Namespace-qualified Building tag (computed once, used by baseline arms)
+BLDG_TAG = '{http://www.opengis.net/citygml/building/2.0}Building'
+
 
 # ============================================================================
 # Benchmark Utilities
@@ -66,57 +97,105 @@ def format_time(seconds):
         return f"{seconds:.2f} s"
 
 
-def create_sample_citygml(num_buildings=100, vertices_per_building=50):
-    """Create a sample CityGML file for benchmarking."""
-    lines = [
-        '<?xml version="1.0" encoding="UTF-8"?>',
-        '<CityModel xmlns="http://www.opengis.net/citygml/2.0"',
-        '           xmlns:bldg="http://www.opengis.net/citygml/building/2.0"',
-        '           xmlns:gml="http://www.opengis.net/gml">'
-    ]
+def _format_sample_pos_list(vertices_per_building):
+    """Format the sample posList text (vertex v is at (10v, 5v, 2v))."""
+    if NUMPY_AVAILABLE:
+        # Build all coordinates in one array op, then join once
+        coords = np.arange(vertices_per_building, dtype=np.float64)[:, None] * (10.0, 5.0, 2.0)
+        return ' '.join(map(str, coords.ravel().tolist()))
 
-    for bld_idx in range(num_buildings):
-        lines.append('  <cityObjectMember>')
-        lines.append(f'    <bldg:Building gml:id="BLD_{bld_idx:06d}">')
-        lines.append(f'      <gml:name>Building {bld_idx}</gml:name>')
-        lines.append('      <bldg:lod2Solid>')
-        lines.append(f'        <gml:Solid gml:id="SOLID_{bld_idx:06d}">')
-        lines.append('          <gml:exterior>')
-        lines.append('            <gml:CompositeSurface>')
-        lines.append('              <gml:surfaceMember>')
-        lines.append(f'                <gml:Polygon gml:id="POLY_{bld_idx:06d}">')
-        lines.append('                  <gml:exterior>')
-        lines.append('                    <gml:LinearRing>')
-
-        # Generate coordinates
-        coords = []
-        for v in range(vertices_per_building):
-            x = float(v * 10.0)
-            y = float(v * 5.0)
-            z = float(v * 2.0)
-            coords.append(f'{x} {y} {z}')
-
-        lines.append(f'                      <gml:posList>{" ".join(coords)}</gml:posList>')
-        lines.append('                    </gml:LinearRing>')
-        lines.append('                  </gml:exterior>')
-        lines.append('                </gml:Polygon>')
-        lines.append('              </gml:surfaceMember>')
-        lines.append('            </gml:CompositeSurface>')
-        lines.append('          </gml:exterior>')
-        lines.append('        </gml:Solid>')
-        lines.append('      </bldg:lod2Solid>')
-        lines.append('    </bldg:Building>')
-        lines.append('  </cityObjectMember>')
-
-    lines.append('</CityModel>')
-
-    return '\n'.join(lines)
+    return ' '.join(
+        f'{float(v * 10.0)} {float(v * 5.0)} {float(v * 2.0)}'
+        for v in range(vertices_per_building)
+    )
+
+
+@contextmanager
+def buffered_output():
+    """Collect a benchmark section's output and write it to stdout once.
+
+    Avoids a stdout write (and flush on some terminals) per print() call;
+    output is still written if the section raises.
+    """
+    buf = io.StringIO()
+    try:
+        with redirect_stdout(buf):
+            yield
+    finally:
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
+
+
+def write_sample_citygml(path, num_buildings=100, vertices_per_building=50):
+    """Write a sample CityGML file for benchmarking directly to disk.
+
+    Lines are written as they are generated so setup does not build the
+    whole document in memory before the memory benchmarks run.
+    """
+    # Coordinates are identical for every building, so format them once
+    pos_list = _format_sample_pos_list(vertices_per_building)
+
+    with open(path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        f.write(
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<CityModel xmlns="http://www.opengis.net/citygml/2.0"\n'
+            '           xmlns:bldg="http://www.opengis.net/citygml/building/2.0"\n'
+            '           xmlns:gml="http://www.opengis.net/gml">\n'
+        )
+
+        for bld_idx in range(num_buildings):
+            f.write(
+                '  <cityObjectMember>\n'
+                f'    <bldg:Building gml:id="BLD_{bld_idx:06d}">\n'
+                f'      <gml:name>Building {bld_idx}</gml:name>\n'
+                '      <bldg:lod2Solid>\n'
+                f'        <gml:Solid gml:id="SOLID_{bld_idx:06d}">\n'
+                '          <gml:exterior>\n'
+                '            <gml:CompositeSurface>\n'
+                '              <gml:surfaceMember>\n'
+                f'                <gml:Polygon gml:id="POLY_{bld_idx:06d}">\n'
+                '                  <gml:exterior>\n'
+                '                    <gml:LinearRing>\n'
+                f'                      <gml:posList>{pos_list}</gml:posList>\n'
+                '                    </gml:LinearRing>\n'
+                '                  </gml:exterior>\n'
+                '                </gml:Polygon>\n'
+                '              </gml:surfaceMember>\n'
+                '            </gml:CompositeSurface>\n'
+                '          </gml:exterior>\n'
+                '        </gml:Solid>\n'
+                '      </bldg:lod2Solid>\n'
+                '    </bldg:Building>\n'
+                '  </cityObjectMember>\n'
+            )
+
+        f.write('</CityModel>')
+
+
+def _create_sample_file(num_buildings):
+    """Create a temporary sample CityGML file and return its path."""
+    with tempfile.NamedTemporaryFile(suffix='.gml', delete=False) as f:
+        citygml_path = f.name
+
+    write_sample_citygml(citygml_path, num_buildings=num_buildings)
+    return citygml_path
 
 
 # ============================================================================
 # Benchmark 1: Coordinate Parsing
 # ============================================================================
 
+def time_per_call(func, elem):
+    """Measure seconds per call of func(elem).
+
+    timeit's autorange picks a loop count that runs for at least 0.2 s,
+    and Timer disables the GC while timing, so sub-microsecond parses are
+    not lost to timer resolution or collection jitter.
+    """
+    loops, total = timeit.Timer(lambda: func(elem)).autorange()
+    return total / loops
+
+
 def benchmark_coordinate_parsing():
     """Benchmark coordinate parsing performance."""
     print("=" * 80)
@@ -136,14 +215,18 @@ def benchmark_coordinate_parsing():
         print(f"\nDataset: {name}")
         print("-" * 40)
 
-        results = benchmark_parsers(data.strip(), iterations=100)
+        elem = ET.Element("pos")
+        elem.text = data.strip()
+
+        results = {name: time_per_call(func, elem) for name, (_, func) in PARSERS.items()}
+        baseline = results['optimized']
 
-        print(f"Optimized (list comprehension): {format_time(results['optimized'])}")
+        # Fastest first, with speedup relative to the optimized parser
+        for name, seconds in sorted(results.items(), key=lambda item: item[1]):
+            label = PARSERS[name][0]
+            print(f"{label:32s}{format_time(seconds):>12s} per call  ({baseline / seconds:.2f}x)")
 
-        if NUMPY_AVAILABLE:
-            print(f"NumPy (vectorized):             {format_time(results['numpy'])}")
-            print(f"Speedup (NumPy vs Optimized):   {results['numpy_speedup']:.2f}x")
-        else:
+        if not NUMPY_AVAILABLE:
             print("NumPy: Not available")
 
     print()
@@ -163,14 +246,7 @@ def benchmark_streaming_memory(citygml_path=None, num_buildings=100):
     # Create sample file if not provided
     if citygml_path is None:
         print(f"Creating sample CityGML file ({num_buildings} buildings)...")
-        citygml_content = create_sample_citygml(num_buildings=num_buildings)
-
-        with tempfile.NamedTemporaryFile(
-            mode='w', suffix='.gml', delete=False, encoding='utf-8'
-        ) as f:
-            f.write(citygml_content)
-            citygml_path = f.name
-
+        citygml_path = _create_sample_file(num_buildings)
         cleanup_file = True
     else:
         cleanup_file = False
@@ -178,18 +254,28 @@ def benchmark_streaming_memory(citygml_path=None, num_buildings=100):
 
     print()
 
-    # Benchmark streaming parser
-    profiler = MemoryProfiler()
-    profiler.start()
-
-    start_time = time.time()
+    # Pass 1: timing with tracemalloc off, so the profiler is not measured
+    start_time = time.perf_counter_ns()
     building_count = 0
 
     for building_elem, xlink_index in stream_parse_buildings(citygml_path):
         building_count += 1
-        profiler.snapshot(f"Building {building_count}")
 
-    elapsed_time = time.time() - start_time
+    elapsed_time = (time.perf_counter_ns() - start_time) / 1e9
+
+    # Pass 2: memory with snapshots at power-of-two building counts only
+    profiler = MemoryProfiler()
+    profiler.start()
+
+    snapshot_count = 0
+    for building_elem, xlink_index in stream_parse_buildings(citygml_path):
+        snapshot_count += 1
+        if snapshot_count & (snapshot_count - 1) == 0:
+            profiler.snapshot(f"Building {snapshot_count}")
+
+    if snapshot_count & (snapshot_count - 1) != 0:
+        profiler.snapshot(f"Building {snapshot_count}")
+
     current, peak = profiler.stop()
 
     print(f"Buildings processed: {building_count}")
@@ -226,39 +312,88 @@ def benchmark_streaming_memory(citygml_path=None, num_buildings=100):
 # Benchmark 3: Streaming vs Legacy Comparison
 # ============================================================================
 
-def benchmark_streaming_vs_legacy(num_buildings=50):
+def count_buildings_dom(citygml_path):
+    """Count buildings after loading the whole file as a DOM (legacy)."""
+    if LXML_AVAILABLE:
+        root = LET.parse(citygml_path).getroot()
+        return sum(1 for _ in root.iter(BLDG_TAG))
+
+    root = ET.parse(citygml_path).getroot()
+    return len(root.findall(f".//{BLDG_TAG}"))
+
+
+def count_buildings_streaming(citygml_path):
+    """Count buildings with the production streaming parser."""
+    count = 0
+    for building_elem, xlink_index in stream_parse_buildings(citygml_path):
+        count += 1
+    return count
+
+
+def _run_with_rusage(func, citygml_path):
+    """Run func(citygml_path) and return its peak RSS growth in bytes."""
+    profiler = MemoryProfilerRusage()
+    profiler.start()
+    func(citygml_path)
+    return profiler.stop()
+
+
+def measure_peak_rss(func, citygml_path):
+    """Measure peak RSS growth of func(citygml_path) in a fresh process.
+
+    Each method runs in its own spawned interpreter so allocator state left
+    by earlier methods does not mask its peak (and so the ru_maxrss fallback
+    on macOS, which never decreases, still works).
+    """
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        return executor.submit(_run_with_rusage, func, citygml_path).result()
+
+
+def count_buildings_iterparse(citygml_path):
+    """Count buildings with ET.iterparse, clearing each one after use.
+
+    This is the fair SAX-style baseline: it streams like the production
+    parser but without XLink indexing or parent detachment.
+    """
+    count = 0
+    for event, elem in ET.iterparse(citygml_path, events=('end',)):
+        if elem.tag == BLDG_TAG:
+            count += 1
+            elem.clear()
+    return count
+
+
+def benchmark_streaming_vs_legacy(citygml_path=None, num_buildings=50):
     """Compare streaming vs legacy parsing (simulated)."""
     print("=" * 80)
     print("BENCHMARK 3: STREAMING VS LEGACY PARSING")
     print("=" * 80)
     print()
 
-    # Create sample file
-    print(f"Creating sample CityGML file ({num_buildings} buildings)...")
-    citygml_content = create_sample_citygml(num_buildings=num_buildings)
-
-    with tempfile.NamedTemporaryFile(
-        mode='w', suffix='.gml', delete=False, encoding='utf-8'
-    ) as f:
-        f.write(citygml_content)
-        citygml_path = f.name
+    # Create sample file if not provided
+    if citygml_path is None:
+        print(f"Creating sample CityGML file ({num_buildings} buildings)...")
+        citygml_path = _create_sample_file(num_buildings)
+        cleanup_file = True
+    else:
+        cleanup_file = False
+        print(f"Using provided file: {citygml_path}")
 
     print()
 
-    # === Legacy Method (ET.parse) ===
-    print("Testing LEGACY method (ET.parse)...")
+    # === Legacy Method (full DOM parse) ===
+    legacy_engine = "lxml.etree.parse" if LXML_AVAILABLE else "ET.parse"
+    print(f"Testing LEGACY method ({legacy_engine})...")
     profiler_legacy = MemoryProfiler()
     profiler_legacy.start()
 
-    start_time_legacy = time.time()
+    start_time_legacy = time.perf_counter_ns()
 
     # Simulate legacy parsing (loads entire file into memory)
-    tree = ET.parse(citygml_path)
-    root = tree.getroot()
-    buildings = root.findall(".//{http://www.opengis.net/citygml/building/2.0}Building")
-    building_count_legacy = len(buildings)
+    building_count_legacy = count_buildings_dom(citygml_path)
 
-    elapsed_time_legacy = time.time() - start_time_legacy
+    elapsed_time_legacy = (time.perf_counter_ns() - start_time_legacy) / 1e9
     current_legacy, peak_legacy = profiler_legacy.stop()
 
     print(f"  Buildings found:   {building_count_legacy}")
@@ -266,9 +401,23 @@ def benchmark_streaming_vs_legacy(num_buildings=50):
     print(f"  Peak memory:       {format_bytes(peak_legacy)}")
     print()
 
-    # Cleanup legacy tree
-    root.clear()
-    del tree, root, buildings
+    gc.collect()
+
+    # === Baseline Method (ET.iterparse + clear) ===
+    print("Testing BASELINE method (ET.iterparse + elem.clear)...")
+    profiler_iterparse = MemoryProfiler()
+    profiler_iterparse.start()
+
+    start_time_iterparse = time.perf_counter_ns()
+    building_count_iterparse = count_buildings_iterparse(citygml_path)
+    elapsed_time_iterparse = (time.perf_counter_ns() - start_time_iterparse) / 1e9
+    current_iterparse, peak_iterparse = profiler_iterparse.stop()
+
+    print(f"  Buildings found:   {building_count_iterparse}")
+    print(f"  Processing time:   {format_time(elapsed_time_iterparse)}")
+    print(f"  Peak memory:       {format_bytes(peak_iterparse)}")
+    print()
+
     gc.collect()
 
     # === Streaming Method ===
@@ -276,13 +425,11 @@ def benchmark_streaming_vs_legacy(num_buildings=50):
     profiler_streaming = MemoryProfiler()
     profiler_streaming.start()
 
-    start_time_streaming = time.time()
+    start_time_streaming = time.perf_counter_ns()
 
-    building_count_streaming = 0
-    for building_elem, xlink_index in stream_parse_buildings(citygml_path):
-        building_count_streaming += 1
+    building_count_streaming = count_buildings_streaming(citygml_path)
 
-    elapsed_time_streaming = time.time() - start_time_streaming
+    elapsed_time_streaming = (time.perf_counter_ns() - start_time_streaming) / 1e9
     current_streaming, peak_streaming = profiler_streaming.stop()
 
     print(f"  Buildings found:   {building_count_streaming}")
@@ -297,23 +444,50 @@ def benchmark_streaming_vs_legacy(num_buildings=50):
     print()
 
     speedup = elapsed_time_legacy / elapsed_time_streaming if elapsed_time_streaming > 0 else 0
+    speedup_iterparse = elapsed_time_iterparse / elapsed_time_streaming if elapsed_time_streaming > 0 else 0
     memory_reduction = ((peak_legacy - peak_streaming) / peak_legacy * 100) if peak_legacy > 0 else 0
+    memory_reduction_iterparse = (
+        (peak_iterparse - peak_streaming) / peak_iterparse * 100
+    ) if peak_iterparse > 0 else 0
+
+    print(f"Legacy engine: {legacy_engine}")
+    if LXML_AVAILABLE:
+        print("  Note: tracemalloc does not see libxml2 allocations, so legacy peak memory is understated")
+    print()
 
     print(f"Processing Speed:")
-    print(f"  Legacy:      {format_time(elapsed_time_legacy)}")
-    print(f"  Streaming:   {format_time(elapsed_time_streaming)}")
-    print(f"  Speedup:     {speedup:.2f}x faster")
+    print(f"  Legacy (DOM parse):    {format_time(elapsed_time_legacy)}")
+    print(f"  Baseline (iterparse):  {format_time(elapsed_time_iterparse)}")
+    print(f"  Streaming:             {format_time(elapsed_time_streaming)}")
+    print(f"  Speedup vs legacy:     {speedup:.2f}x faster")
+    print(f"  Speedup vs baseline:   {speedup_iterparse:.2f}x faster")
     print()
 
     print(f"Memory Usage:")
-    print(f"  Legacy:      {format_bytes(peak_legacy)}")
-    print(f"  Streaming:   {format_bytes(peak_streaming)}")
-    print(f"  Reduction:   {memory_reduction:.1f}% less memory")
+    print(f"  Legacy (DOM parse):    {format_bytes(peak_legacy)}")
+    print(f"  Baseline (iterparse):  {format_bytes(peak_iterparse)}")
+    print(f"  Streaming:             {format_bytes(peak_streaming)}")
+    print(f"  Reduction vs legacy:   {memory_reduction:.1f}% less memory")
+    print(f"  Reduction vs baseline: {memory_reduction_iterparse:.1f}% less memory")
     print()
 
+    # tracemalloc slows allocation-heavy code and misses native memory;
+    # report raw peak RSS (one fresh process per method) alongside it
+    if RUSAGE_AVAILABLE:
+        rss_legacy = measure_peak_rss(count_buildings_dom, citygml_path)
+        rss_iterparse = measure_peak_rss(count_buildings_iterparse, citygml_path)
+        rss_streaming = measure_peak_rss(count_buildings_streaming, citygml_path)
+
+        print(f"Peak RSS growth (VmHWM/getrusage, separate process per method):")
+        print(f"  Legacy (DOM parse):    {format_bytes(rss_legacy)}")
+        print(f"  Baseline (iterparse):  {format_bytes(rss_iterparse)}")
+        print(f"  Streaming:             {format_bytes(rss_streaming)}")
+        print()
+
     # Cleanup
-    import os
-    os.unlink(citygml_path)
+    if cleanup_file:
+        import os
+        os.unlink(citygml_path)
 
 
 # ============================================================================
@@ -360,19 +534,33 @@ def main():
     print("╚" + "═" * 78 + "╝")
     print()
 
+    # Generate one sample file shared by the memory and comparison benchmarks
+    citygml_path = args.citygml_file
+    sample_path = None
+    if citygml_path is None and not (args.skip_memory and args.skip_comparison):
+        print(f"Creating sample CityGML file ({args.num_buildings} buildings)...")
+        print()
+        sample_path = citygml_path = _create_sample_file(args.num_buildings)
+
     # Run benchmarks
     try:
         if not args.skip_coordinate:
-            benchmark_coordinate_parsing()
+            with buffered_output():
+                benchmark_coordinate_parsing()
 
         if not args.skip_memory:
-            benchmark_streaming_memory(
-                citygml_path=args.citygml_file,
-                num_buildings=args.num_buildings
-            )
+            with buffered_output():
+                benchmark_streaming_memory(
+                    citygml_path=citygml_path,
+                    num_buildings=args.num_buildings
+                )
 
         if not args.skip_comparison:
-            benchmark_streaming_vs_legacy(num_buildings=args.num_buildings)
+            with buffered_output():
+                benchmark_streaming_vs_legacy(
+                    citygml_path=citygml_path,
+                    num_buildings=args.num_buildings
+                )
 
         print()
         print("=" * 80)
@@ -396,6 +584,11 @@ def main():
         traceback.print_exc()
         return 1
 
+    finally:
+        if sample_path is not None:
+            import os
+            os.unlink(sample_path)
+
     return 0
 
 
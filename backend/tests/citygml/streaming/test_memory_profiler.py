@@ -0,0 +1,60 @@
+"""
+Unit tests for the peak-RSS memory profiler
+
+Tests cover:
+1. A large allocation shows up as non-zero peak growth
+2. The same holds in a spawned child process (as used by the benchmark)
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+# Import the memory profiler
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from services.citygml.streaming.memory_profiler import MemoryProfilerRusage
+
+ALLOC_BYTES = 64 * 1024 * 1024
+
+requires_peak_rss = pytest.mark.skipif(
+    MemoryProfilerRusage.get_peak_rss() == 0,
+    reason="peak RSS is not available on this platform",
+)
+
+
+def _allocate_and_measure() -> int:
+    profiler = MemoryProfilerRusage()
+    profiler.start()
+    buf = bytearray(ALLOC_BYTES)
+    buf[::4096] = b"\x01" * len(buf[::4096])  # touch every page
+    growth = profiler.stop()
+    del buf
+    return growth
+
+
+@requires_peak_rss
+def test_large_allocation_is_visible():
+    """A 64 MB allocation must raise the reported peak by roughly that much."""
+    # An earlier, bigger peak must not mask the measurement. Only a
+    # resettable high-water mark (VmHWM) can pass this; the ru_maxrss
+    # fallback keeps the warmup peak for the life of the process.
+    if not MemoryProfilerRusage._reset_peak_rss():
+        pytest.skip("peak RSS cannot be reset on this platform")
+    warmup = bytearray(2 * ALLOC_BYTES)
+    warmup[::4096] = b"\x01" * len(warmup[::4096])
+    del warmup
+
+    assert _allocate_and_measure() >= ALLOC_BYTES // 2
+
+
+@requires_peak_rss
+def test_large_allocation_is_visible_in_spawned_child():
+    """The child must not inherit the parent's high-water mark."""
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        growth = executor.submit(_allocate_and_measure).result()
+    assert growth >= ALLOC_BYTES // 2
@@ -0,0 +1,105 @@
+"""
+Unit tests for CityGML Parallel Coordinate Parsing
+
+Tests cover:
+1. Inline processing for small inputs
+2. Worker-process processing matches sequential parsing
+3. Streaming filters (limit) are honoured
+"""
+
+import pytest
+from pathlib import Path
+import tempfile
+import os
+
+# Import the parallel parser
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from services.citygml.streaming.parallel import parallel_parse_buildings
+from services.citygml.streaming.parser import stream_parse_buildings, StreamingConfig
+from services.citygml.streaming.coordinate_optimizer import parse_poslist_optimized
+
+
+# ============================================================================
+# Test Fixtures
+# ============================================================================
+
+def _write_citygml(num_buildings):
+    """Write a CityGML file whose building i has two triangles offset by i."""
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.gml', delete=False, encoding='utf-8') as f:
+        f.write(
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<CityModel xmlns="http://www.opengis.net/citygml/2.0" '
+            'xmlns:bldg="http://www.opengis.net/citygml/building/2.0" '
+            'xmlns:gml="http://www.opengis.net/gml">'
+        )
+        for i in range(num_buildings):
+            f.write(f'<cityObjectMember><bldg:Building gml:id="BLD_{i:03d}">')
+            for z in (0.0, 5.0):
+                f.write(
+                    f'<gml:Polygon><gml:posList>{i} 0 {z} {i + 1} 0 {z} {i} 1 {z} {i} 0 {z}'
+                    '</gml:posList></gml:Polygon>'
+                )
+            f.write('</bldg:Building></cityObjectMember>')
+        f.write('</CityModel>')
+        return f.name
+
+
+@pytest.fixture
+def sample_citygml_path():
+    """CityGML file with enough buildings to use two worker processes."""
+    path = _write_citygml(12)
+    yield path
+    if os.path.exists(path):
+        os.unlink(path)
+
+
+def _sequential_coordinates(gml_path):
+    """Reference result built with the sequential streaming parser."""
+    return [
+        (building.get('{http://www.opengis.net/gml}id'),
+         [parse_poslist_optimized(p) for p in building.iter('{http://www.opengis.net/gml}posList')])
+        for building, _ in stream_parse_buildings(gml_path)
+    ]
+
+
+def _as_tuples(results):
+    """Normalize ndarray/list coordinates to lists of tuples."""
+    return [(gml_id, [[tuple(pt) for pt in ring] for ring in rings]) for gml_id, rings in results]
+
+
+# ============================================================================
+# Parallel Parsing Tests
+# ============================================================================
+
+def test_parallel_parse_inline_for_small_input(sample_citygml_path):
+    """Test that fewer than 2 x workers buildings are parsed inline."""
+    results = list(parallel_parse_buildings(sample_citygml_path, workers=8))
+
+    assert len(results) == 12
+    assert _as_tuples(results) == _sequential_coordinates(sample_citygml_path)
+
+
+def test_parallel_parse_matches_sequential(sample_citygml_path):
+    """Test that worker-process results match sequential parsing, in order."""
+    results = list(parallel_parse_buildings(sample_citygml_path, workers=2))
+
+    assert [gml_id for gml_id, _ in results] == [f'BLD_{i:03d}' for i in range(12)]
+    assert _as_tuples(results) == _sequential_coordinates(sample_citygml_path)
+
+
+def test_parallel_parse_respects_limit(sample_citygml_path):
+    """Test that StreamingConfig.limit applies to the parallel parser."""
+    config = StreamingConfig(limit=5, enable_gc_per_building=False)
+    results = list(parallel_parse_buildings(sample_citygml_path, workers=2, config=config))
+
+    assert [gml_id for gml_id, _ in results] == [f'BLD_{i:03d}' for i in range(5)]
+
+
+# ============================================================================
+# Run Tests
+# ============================================================================
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
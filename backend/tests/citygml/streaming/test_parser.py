@@ -14,12 +14,14 @@ import pytest
 import xml.etree.ElementTree as ET
 from pathlib import Path
 import tempfile
+import tracemalloc
 import os
 
 # Import the streaming parser
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
+from services.citygml.streaming import parser as streaming_parser
 from services.citygml.streaming.parser import (
     stream_parse_buildings,
     StreamingConfig,
@@ -210,6 +212,20 @@ def test_stream_parse_multiple_buildings(sample_citygml_multiple_buildings):
         assert building_id in xlink_index
 
 
+def test_stream_parse_etree_fallback(sample_citygml_multiple_buildings, monkeypatch):
+    """Test that the xml.etree backend yields the same buildings as lxml."""
+    expected = [
+        (ET.tostring(b), sorted(x))
+        for b, x in stream_parse_buildings(sample_citygml_multiple_buildings)
+    ]
+
+    monkeypatch.setattr(streaming_parser, 'LXML_AVAILABLE', False)
+    buildings = list(stream_parse_buildings(sample_citygml_multiple_buildings))
+
+    assert all(isinstance(b, ET.Element) for b, _ in buildings)
+    assert [(ET.tostring(b), sorted(x)) for b, x in buildings] == expected
+
+
 # ============================================================================
 # Limit Tests
 # ============================================================================
@@ -312,6 +328,58 @@ def test_xlink_index_isolation(sample_citygml_multiple_buildings):
     assert 'BLD_002' not in indices[0]
 
 
+def _write_synthetic_citygml(num_buildings):
+    """Write a CityGML file with num_buildings small buildings; return its path."""
+    pos_list = ' '.join(['1.0'] * 300)
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.gml', delete=False, encoding='utf-8') as f:
+        f.write(
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<CityModel xmlns="http://www.opengis.net/citygml/2.0" '
+            'xmlns:bldg="http://www.opengis.net/citygml/building/2.0" '
+            'xmlns:gml="http://www.opengis.net/gml">'
+        )
+        for i in range(num_buildings):
+            f.write(
+                f'<cityObjectMember><bldg:Building gml:id="BLD_{i:05d}">'
+                f'<gml:Polygon gml:id="POLY_{i:05d}"><gml:posList>{pos_list}</gml:posList></gml:Polygon>'
+                '</bldg:Building></cityObjectMember>'
+            )
+        f.write('</CityModel>')
+        return f.name
+
+
+def _peak_traced_memory(gml_path):
+    """Consume the stream and return (building count, tracemalloc peak bytes)."""
+    config = StreamingConfig(enable_gc_per_building=False)
+    tracemalloc.start()
+    try:
+        count = sum(1 for _ in stream_parse_buildings(gml_path, config=config))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return count, peak
+
+
+def test_stream_parse_memory_bounded():
+    """Test that peak memory does not grow with the number of buildings."""
+    small_path = _write_synthetic_citygml(100)
+    large_path = _write_synthetic_citygml(1000)
+
+    try:
+        small_count, small_peak = _peak_traced_memory(small_path)
+        large_count, large_peak = _peak_traced_memory(large_path)
+    finally:
+        os.unlink(small_path)
+        os.unlink(large_path)
+
+    assert small_count == 100
+    assert large_count == 1000
+
+    # Processed members are recycled, so 10x the buildings must not
+    # mean 10x the memory (O(1 building), not O(file))
+    assert large_peak < small_peak * 1.25
+
+
 # ============================================================================
 # StreamingConfig Tests
 # ============================================================================
@@ -0,0 +1,91 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from services.coordinate_utils import (
+    NUMPY_AVAILABLE,
+    detect_epsg_from_srs,
+    get_crs_info,
+    get_japan_plane_zone,
+    get_japan_plane_zones_batch,
+    is_geographic_crs,
+)
+
+if NUMPY_AVAILABLE:
+    import numpy as np
+
+
+# Tokyo Station, Osaka, Sapporo, Naha, central fallback, Seoul, zone edge
+SAMPLE_POINTS = [
+    (35.681236, 139.767125),
+    (34.6937, 135.5022),
+    (43.0618, 141.3545),
+    (26.2124, 127.6809),
+    (34.5, 138.5),
+    (37.5665, 126.9780),
+    (35.5, 136.5),
+]
+
+
+@pytest.mark.parametrize(
+    ("srs", "expected"),
+    [
+        ("http://www.opengis.net/def/crs/EPSG/0/6697", "EPSG:6697"),
+        ("urn:ogc:def:crs:EPSG::6697", "EPSG:6697"),
+        ("EPSG:6677", "EPSG:6677"),
+        ("epsg:4326", "EPSG:4326"),
+        ("Epsg:6668", "EPSG:6668"),
+        ("urn:ogc:def:crs:OGC:1.3:CRS84", None),
+        ("EPSG", None),
+        ("", None),
+    ],
+)
+def test_detect_epsg_from_srs(srs: str, expected) -> None:
+    assert detect_epsg_from_srs(srs) == expected
+
+
+@pytest.mark.parametrize(
+    ("epsg_code", "expected"),
+    [
+        ("EPSG:6697", True),
+        ("epsg:4326", True),
+        ("6668", True),
+        ("EPSG:6677", False),
+        ("urn:ogc:def:crs:EPSG::6697", False),
+        ("", False),
+    ],
+)
+def test_is_geographic_crs(epsg_code: str, expected: bool) -> None:
+    assert is_geographic_crs(epsg_code) is expected
+
+
+def test_get_crs_info_returns_independent_copies() -> None:
+    info = get_crs_info("EPSG:6677")
+    assert info["type"] == "projected"
+
+    info["name"] = "modified"
+    assert get_crs_info("EPSG:6677")["name"] == "JGD2011 / Japan Plane Rectangular CS IX"
+
+
+def test_get_japan_plane_zone_tokyo() -> None:
+    assert get_japan_plane_zone(35.681236, 139.767125) == "EPSG:6677"
+
+
+def test_get_japan_plane_zone_outside_japan() -> None:
+    assert get_japan_plane_zone(51.5074, -0.1278) is None
+
+
+@pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy not available")
+def test_get_japan_plane_zones_batch_matches_scalar() -> None:
+    rng = np.random.default_rng(0)
+    lats = np.concatenate([[p[0] for p in SAMPLE_POINTS], rng.uniform(18.0, 48.0, 5000)])
+    lons = np.concatenate([[p[1] for p in SAMPLE_POINTS], rng.uniform(120.0, 156.0, 5000)])
+
+    zones = get_japan_plane_zones_batch(lats, lons)
+
+    assert zones.tolist() == [
+        get_japan_plane_zone(lat, lon) for lat, lon in zip(lats.tolist(), lons.tolist())
+    ]
@@ -0,0 +1,129 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.mesh_utils import (
+    NUMPY_AVAILABLE,
+    get_neighboring_meshes_3rd,
+    latlon_to_mesh_1st,
+    latlon_to_mesh_2nd,
+    latlon_to_mesh_3rd,
+    latlon_to_mesh_3rd_batch,
+    latlon_to_mesh_3rd_bytes,
+    latlon_to_mesh_half,
+    latlon_to_mesh_quarter,
+)
+
+if NUMPY_AVAILABLE:
+    import numpy as np
+
+
+# Tokyo Station, Shibuya, Osaka, Sapporo, Naha
+SAMPLE_POINTS = [
+    (35.681236, 139.767125),
+    (35.658034, 139.701636),
+    (34.6937, 135.5022),
+    (43.0618, 141.3545),
+    (26.2124, 127.6809),
+]
+
+
+def test_latlon_to_mesh_3rd_tokyo_station() -> None:
+    assert latlon_to_mesh_3rd(35.681236, 139.767125) == "53394611"
+
+
+@pytest.mark.parametrize(("lat", "lon"), SAMPLE_POINTS)
+def test_latlon_to_mesh_3rd_bytes_matches_str(lat: float, lon: float) -> None:
+    assert latlon_to_mesh_3rd_bytes(lat, lon) == latlon_to_mesh_3rd(lat, lon).encode("ascii")
+
+
+def test_latlon_to_mesh_3rd_is_memoized() -> None:
+    latlon_to_mesh_3rd.cache_clear()
+
+    first = latlon_to_mesh_3rd(35.681236, 139.767125)
+    second = latlon_to_mesh_3rd(35.681236, 139.767125)
+
+    assert first == second == "53394611"
+    assert latlon_to_mesh_3rd.cache_info().hits == 1
+
+
+@pytest.mark.parametrize(("lat", "lon"), SAMPLE_POINTS)
+def test_mesh_levels_are_nested(lat: float, lon: float) -> None:
+    quarter = latlon_to_mesh_quarter(lat, lon)
+
+    assert len(quarter) == 10
+    assert quarter[:9] == latlon_to_mesh_half(lat, lon)
+    assert quarter[:8] == latlon_to_mesh_3rd(lat, lon)
+    assert quarter[:6] == latlon_to_mesh_2nd(lat, lon)
+    assert quarter[:4] == latlon_to_mesh_1st(lat, lon)
+    assert quarter[8] in "1234" and quarter[9] in "1234"
+
+
+def test_neighboring_meshes_carry_into_2nd_mesh() -> None:
+    # t=9, u=0: neighbours cross into the next r row and previous s column
+    assert get_neighboring_meshes_3rd("53394590") == [
+        "53394489", "53394580", "53394581",
+        "53394499", "53394590", "53394591",
+        "53395409", "53395500", "53395501",
+    ]
+
+
+def test_neighboring_meshes_skip_outside_1st_mesh() -> None:
+    # r=0, s=0, t=0, u=0: only the centre's upper-right quadrant remains
+    assert get_neighboring_meshes_3rd("53390000") == [
+        "53390000", "53390001", "53390010", "53390011",
+    ]
+
+
+@pytest.mark.parametrize("mesh_code", ["5339459", "5339459A", "533945９0"])
+def test_neighboring_meshes_reject_invalid_code(mesh_code: str) -> None:
+    with pytest.raises(ValueError):
+        get_neighboring_meshes_3rd(mesh_code)
+
+
+# Outside Japan the indices leave the digit tables; the codes must stay
+# visibly invalid (as before the tables) rather than wrap around
+OUT_OF_RANGE_CODES = [
+    ((-10, 50), "-15-500000"),
+    ((0, 0), "00-1000000"),
+    ((35.68, 99.5), "53004-410"),
+    ((70, 140), "105400000"),
+]
+
+
+@pytest.mark.parametrize(("latlon", "expected"), OUT_OF_RANGE_CODES)
+def test_latlon_to_mesh_3rd_out_of_range(latlon, expected: str) -> None:
+    assert latlon_to_mesh_3rd(*latlon) == expected
+    assert latlon_to_mesh_3rd_bytes(*latlon) == expected.encode("ascii")
+
+
+@pytest.mark.parametrize(("latlon", "expected"), OUT_OF_RANGE_CODES)
+def test_mesh_levels_out_of_range_keep_prefix(latlon, expected: str) -> None:
+    quarter = latlon_to_mesh_quarter(*latlon)
+    assert quarter.startswith(latlon_to_mesh_half(*latlon))
+    assert latlon_to_mesh_half(*latlon).startswith(expected)
+    assert expected.startswith(latlon_to_mesh_2nd(*latlon))
+    assert latlon_to_mesh_2nd(*latlon).startswith(latlon_to_mesh_1st(*latlon))
+
+
+@pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy not available")
+def test_latlon_to_mesh_3rd_batch_matches_scalar() -> None:
+    rng = np.random.default_rng(0)
+    lats = np.concatenate([[p[0] for p in SAMPLE_POINTS], rng.uniform(24.0, 45.5, 2000)])
+    lons = np.concatenate([[p[1] for p in SAMPLE_POINTS], rng.uniform(123.0, 148.0, 2000)])
+
+    codes = latlon_to_mesh_3rd_batch(lats, lons)
+
+    assert codes.dtype == np.dtype("S8")
+    assert codes.astype(str).tolist() == [
+        latlon_to_mesh_3rd(lat, lon) for lat, lon in zip(lats.tolist(), lons.tolist())
+    ]
+
+
+@pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy not available")
+def test_latlon_to_mesh_3rd_batch_rejects_out_of_range() -> None:
+    with pytest.raises(ValueError, match="lat=-10"):
+        latlon_to_mesh_3rd_batch([35.681236, -10.0], [139.767125, 50.0])
@@ -12,7 +12,7 @@ This test suite verifies:
 
 import json
 import os
-import tempfile
+import shutil
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 import pytest
@@ -36,47 +36,50 @@ from services.plateau_fetcher import (
 )
 
 
-@pytest.fixture
-def temp_cache_dir():
-    """Create a temporary cache directory structure for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        cache_dir = Path(tmpdir)
-
-        # Create mesh index
-        mesh_index = {
-            "version": "1.0.0",
-            "created_at": "2024-01-12T10:00:00Z",
-            "index": {
-                "53393580": "13101",  # Chiyoda-ku
-                "53393581": "13101",
-                "53393586": "13113",  # Shibuya-ku
-                "53393587": ["13113", "13104"]  # Mesh spanning multiple wards
-            }
+@pytest.fixture(scope="session")
+def session_cache_dir(tmp_path_factory):
+    """Create a temporary cache directory structure for testing.
+
+    Built once per session; use it through temp_cache_dir (read-only) or
+    writable_cache_dir (private copy).
+    """
+    cache_dir = tmp_path_factory.mktemp("citygml_cache")
+
+    # Create mesh index
+    mesh_index = {
+        "version": "1.0.0",
+        "created_at": "2024-01-12T10:00:00Z",
+        "index": {
+            "53393580": "13101",  # Chiyoda-ku
+            "53393581": "13101",
+            "53393586": "13113",  # Shibuya-ku
+            "53393587": ["13113", "13104"]  # Mesh spanning multiple wards
         }
+    }
 
-        with open(cache_dir / "mesh_to_ward_index.json", 'w', encoding='utf-8') as f:
-            json.dump(mesh_index, f)
+    with open(cache_dir / "mesh_to_ward_index.json", 'w', encoding='utf-8') as f:
+        json.dump(mesh_index, f)
 
-        # Create ward directory for Chiyoda-ku (13101)
-        ward_dir = cache_dir / "13101_千代田区"
-        ward_dir.mkdir(parents=True)
+    # Create ward directory for Chiyoda-ku (13101)
+    ward_dir = cache_dir / "13101_千代田区"
+    ward_dir.mkdir(parents=True)
 
-        # Create ward metadata
-        ward_metadata = {
-            "area_code": "13101",
-            "ward_name": "千代田区",
-            "mesh_codes": ["53393580", "53393581"]
-        }
+    # Create ward metadata
+    ward_metadata = {
+        "area_code": "13101",
+        "ward_name": "千代田区",
+        "mesh_codes": ["53393580", "53393581"]
+    }
 
-        with open(ward_dir / "ward_metadata.json", 'w', encoding='utf-8') as f:
-            json.dump(ward_metadata, f)
+    with open(ward_dir / "ward_metadata.json", 'w', encoding='utf-8') as f:
+        json.dump(ward_metadata, f)
 
-        # Create GML files
-        gml_dir = ward_dir / "udx" / "bldg"
-        gml_dir.mkdir(parents=True)
+    # Create GML files
+    gml_dir = ward_dir / "udx" / "bldg"
+    gml_dir.mkdir(parents=True)
 
-        # Sample CityGML content
-        sample_gml = """<?xml version="1.0" encoding="UTF-8"?>
+    # Sample CityGML content
+    sample_gml = """<?xml version="1.0" encoding="UTF-8"?>
 <core:CityModel xmlns:core="http://www.opengis.net/citygml/2.0"
                 xmlns:bldg="http://www.opengis.net/citygml/building/2.0"
                 xmlns:gml="http://www.opengis.net/gml">
@@ -87,38 +90,60 @@ def temp_cache_dir():
   </core:cityObjectMember>
 </core:CityModel>"""
 
-        with open(gml_dir / "53393580_bldg_001_op.gml", 'w', encoding='utf-8') as f:
-            f.write(sample_gml)
+    with open(gml_dir / "53393580_bldg_001_op.gml", 'w', encoding='utf-8') as f:
+        f.write(sample_gml)
 
-        with open(gml_dir / "53393580_bldg_002_op.gml", 'w', encoding='utf-8') as f:
-            f.write(sample_gml.replace("test_building_1", "test_building_2"))
+    with open(gml_dir / "53393580_bldg_002_op.gml", 'w', encoding='utf-8') as f:
+        f.write(sample_gml.replace("test_building_1", "test_building_2"))
 
-        # Create ward directories for multi-ward mesh (53393587 spans 13113 and 13104)
-        multi_ward_samples = [
-            ("13113", "渋谷区", "multi_ward_building_1"),
-            ("13104", "新宿区", "multi_ward_building_2"),
-        ]
+    # Create ward directories for multi-ward mesh (53393587 spans 13113 and 13104)
+    multi_ward_samples = [
+        ("13113", "渋谷区", "multi_ward_building_1"),
+        ("13104", "新宿区", "multi_ward_building_2"),
+    ]
 
-        for area_code, ward_name, building_id in multi_ward_samples:
-            ward_dir = cache_dir / f"{area_code}_{ward_name}"
-            ward_dir.mkdir(parents=True)
+    for area_code, ward_name, building_id in multi_ward_samples:
+        ward_dir = cache_dir / f"{area_code}_{ward_name}"
+        ward_dir.mkdir(parents=True)
 
-            ward_metadata = {
-                "area_code": area_code,
-                "ward_name": ward_name,
-                "mesh_codes": ["53393587"]
-            }
+        ward_metadata = {
+            "area_code": area_code,
+            "ward_name": ward_name,
+            "mesh_codes": ["53393587"]
+        }
+
+        with open(ward_dir / "ward_metadata.json", 'w', encoding='utf-8') as f:
+            json.dump(ward_metadata, f)
+
+        gml_dir = ward_dir / "udx" / "bldg"
+        gml_dir.mkdir(parents=True)
+        gml_content = sample_gml.replace("test_building_1", building_id)
+        with open(gml_dir / "53393587_bldg_001_op.gml", 'w', encoding='utf-8') as f:
+            f.write(gml_content)
 
-            with open(ward_dir / "ward_metadata.json", 'w', encoding='utf-8') as f:
-                json.dump(ward_metadata, f)
+    yield cache_dir
 
-            gml_dir = ward_dir / "udx" / "bldg"
-            gml_dir.mkdir(parents=True)
-            gml_content = sample_gml.replace("test_building_1", building_id)
-            with open(gml_dir / "53393587_bldg_001_op.gml", 'w', encoding='utf-8') as f:
-                f.write(gml_content)
 
-        yield cache_dir
+@pytest.fixture
+def temp_cache_dir(session_cache_dir):
+    """Shared cache directory without a mesh index snapshot.
+
+    _load_mesh_index() writes mesh_to_ward_index.cache.npz next to the
+    JSON; drop it around every test so each one starts from the JSON
+    index rather than whatever an earlier test snapshotted.
+    """
+    snapshot = session_cache_dir / "mesh_to_ward_index.cache.npz"
+    snapshot.unlink(missing_ok=True)
+    yield session_cache_dir
+    snapshot.unlink(missing_ok=True)
+
+
+@pytest.fixture
+def writable_cache_dir(temp_cache_dir, tmp_path):
+    """Private copy of the session cache directory for tests that modify it."""
+    cache_dir = tmp_path / "citygml_cache"
+    shutil.copytree(temp_cache_dir, cache_dir)
+    return cache_dir
 
 
 class TestCacheConfiguration:
@@ -142,6 +167,19 @@ class TestCacheConfiguration:
             assert str(config["cache_dir"]) == "/custom/path"
 
 
+    def test_get_cache_config_cached_per_environment(self):
+        """Test config is reused until the CITYGML_* variables change."""
+        with patch.dict(os.environ, {"CITYGML_CACHE_ENABLED": "true"}):
+            config1 = _get_cache_config()
+            config2 = _get_cache_config()
+            assert config1 is config2
+            with pytest.raises(TypeError):
+                config1["enabled"] = False
+
+        with patch.dict(os.environ, {"CITYGML_CACHE_ENABLED": "false"}):
+            assert _get_cache_config()["enabled"] is False
+
+
 class TestMeshIndexLoading:
     """Test mesh index loading and caching."""
 
@@ -168,7 +206,7 @@ class TestMeshIndexLoading:
             index = _load_mesh_index()
             assert "53393580" in index
             assert index["53393580"] == "13101"
-            assert index["53393587"] == ["13113", "13104"]  # Multi-ward mesh
+            assert index["53393587"] == "13113,13104"  # Multi-ward mesh (comma-joined)
 
     def test_load_mesh_index_caching(self, temp_cache_dir):
         """Test that mesh index is cached after first load."""
@@ -185,6 +223,139 @@ class TestMeshIndexLoading:
             # Should return same object (cached)
             assert index1 is index2
 
+    def test_load_mesh_index_concurrent_first_load(self, temp_cache_dir):
+        """Test that concurrent first calls parse the index only once."""
+        import threading
+        import time
+        import services.plateau_fetcher
+        services.plateau_fetcher._MESH_INDEX_CACHE = None
+
+        real_read = services.plateau_fetcher._read_mesh_index
+        calls = []
+
+        def slow_read():
+            calls.append(1)
+            time.sleep(0.05)
+            return real_read()
+
+        results = []
+        with patch.dict(os.environ, {
+            "CITYGML_CACHE_ENABLED": "true",
+            "CITYGML_CACHE_DIR": str(temp_cache_dir)
+        }), patch.object(services.plateau_fetcher, "_read_mesh_index", side_effect=slow_read):
+            threads = [
+                threading.Thread(target=lambda: results.append(_load_mesh_index()))
+                for _ in range(8)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert len(calls) == 1
+        assert len(results) == 8
+        assert all(index is results[0] for index in results)
+
+    def test_load_mesh_index_stdlib_json_fallback(self, temp_cache_dir):
+        """Test mesh index loading without orjson installed."""
+        # Clear module-level cache
+        import services.plateau_fetcher
+        services.plateau_fetcher._MESH_INDEX_CACHE = None
+
+        with patch.dict(os.environ, {
+            "CITYGML_CACHE_ENABLED": "true",
+            "CITYGML_CACHE_DIR": str(temp_cache_dir)
+        }), patch.object(services.plateau_fetcher, "ORJSON_AVAILABLE", False), patch.object(
+            services.plateau_fetcher,
+            "_read_mesh_index_file",
+            wraps=services.plateau_fetcher._read_mesh_index_file,
+        ) as spy_read:
+            index = _load_mesh_index()
+            assert index["53393580"] == "13101"
+            assert index["53393587"] == "13113,13104"
+            # Parsed from the JSON with the stdlib, not loaded from a snapshot
+            spy_read.assert_called_once()
+
+
+    def test_load_mesh_index_snapshot(self, writable_cache_dir):
+        """Test .npz snapshot is reused until the JSON changes."""
+        import services.plateau_fetcher
+        env = {
+            "CITYGML_CACHE_ENABLED": "true",
+            "CITYGML_CACHE_DIR": str(writable_cache_dir)
+        }
+
+        with patch.dict(os.environ, env):
+            services.plateau_fetcher._MESH_INDEX_CACHE = None
+            _load_mesh_index()
+            assert (writable_cache_dir / "mesh_to_ward_index.cache.npz").exists()
+
+            # Fresh snapshot: JSON is not parsed again
+            services.plateau_fetcher._MESH_INDEX_CACHE = None
+            with patch.object(services.plateau_fetcher, "_read_mesh_index_file") as mock_read:
+                index = _load_mesh_index()
+                assert not mock_read.called
+            assert index["53393587"] == "13113,13104"
+
+            # Rewritten JSON invalidates the snapshot
+            index_path = writable_cache_dir / "mesh_to_ward_index.json"
+            with open(index_path, 'w', encoding='utf-8') as f:
+                json.dump({"index": {"53393580": "13199"}}, f)
+            stat = index_path.stat()
+            os.utime(index_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+            services.plateau_fetcher._MESH_INDEX_CACHE = None
+            index = _load_mesh_index()
+            assert index["53393580"] == "13199"
+            assert "53393587" not in index
+
+    def test_load_mesh_index_snapshot_rejects_pickled_arrays(self, writable_cache_dir):
+        """Test a snapshot needing pickle is ignored instead of unpickled."""
+        np = pytest.importorskip("numpy")
+        import services.plateau_fetcher
+        from services.plateau_fetcher import _snapshot_stamp
+
+        index_path = writable_cache_dir / "mesh_to_ward_index.json"
+        with open(writable_cache_dir / "mesh_to_ward_index.cache.npz", 'wb') as f:
+            np.savez(
+                f,
+                stamp=np.array(_snapshot_stamp(index_path), dtype=np.int64),
+                meshes=np.array([53393580], dtype=np.uint32),
+                ward_ids=np.array([0], dtype=np.uint32),
+                wards=np.array([{"not": "a str"}], dtype=object),
+            )
+
+        with patch.dict(os.environ, {
+            "CITYGML_CACHE_ENABLED": "true",
+            "CITYGML_CACHE_DIR": str(writable_cache_dir)
+        }):
+            services.plateau_fetcher._MESH_INDEX_CACHE = None
+            index = _load_mesh_index()
+            assert index["53393580"] == "13101"
+
+    def test_compact_mesh_index_matches_dict(self):
+        """Test compact uint32 index behaves like the parsed dict."""
+        pytest.importorskip("numpy")
+        from services.plateau_fetcher import _CompactMeshIndex
+
+        raw = {
+            "53393586": "13113",
+            "53393580": "13101",
+            "53393587": "13113,13104",
+            "53393581": "13101",
+        }
+        assert _CompactMeshIndex.supports(raw)
+        assert not _CompactMeshIndex.supports({"533935": "13101"})
+
+        index = _CompactMeshIndex(raw)
+        assert dict(index) == raw
+        assert len(index) == 4
+        assert index["53393587"] == "13113,13104"
+        assert index.get("99999999") is None
+        assert index[b"53393586"] == "13113"  # ASCII bytes keys
+        assert "5339358" not in index
+        assert index["53393580"] is index["53393581"]  # Interned ward value
+
 
 class TestWardResolution:
     """Test mesh code to ward resolution."""
@@ -228,6 +399,25 @@ class TestWardResolution:
             wards = _get_wards_from_mesh("53393587")
             assert wards == ["13113", "13104"]
 
+    def test_get_wards_from_mesh_streaming(self, temp_cache_dir):
+        """Test CITYGML_INDEX_STREAMING lookups (full load without ijson)."""
+        # Clear module-level cache
+        import services.plateau_fetcher
+        services.plateau_fetcher._MESH_INDEX_CACHE = None
+
+        with patch.dict(os.environ, {
+            "CITYGML_CACHE_ENABLED": "true",
+            "CITYGML_CACHE_DIR": str(temp_cache_dir),
+            "CITYGML_INDEX_STREAMING": "1"
+        }):
+            assert _get_ward_from_mesh("53393580") == "13101"
+            assert _get_wards_from_mesh("53393587") == ["13113", "13104"]
+            assert _get_ward_from_mesh("99999999") is None
+
+            # Streaming never populates the in-memory index
+            if services.plateau_fetcher.IJSON_AVAILABLE:
+                assert services.plateau_fetcher._MESH_INDEX_CACHE is None
+
     def test_get_ward_from_mesh_not_found(self, temp_cache_dir):
         """Test ward resolution for unknown mesh code."""
         # Clear module-level cache
@@ -320,6 +510,44 @@ class TestCombineGmlFiles:
         assert combined.count("cityObjectMember") >= 2
 
 
+    def test_combine_gml_files_splices_bytes(self, temp_cache_dir):
+        """Test byte-level merge keeps original prefixes and yields valid XML."""
+        import xml.etree.ElementTree as ET
+
+        gml_dir = temp_cache_dir / "13101_千代田区" / "udx" / "bldg"
+        combined = _combine_gml_files([
+            gml_dir / "53393580_bldg_001_op.gml",
+            gml_dir / "53393580_bldg_002_op.gml"
+        ])
+
+        assert combined.startswith('<?xml version="1.0" encoding="UTF-8"?>')
+        assert "<core:cityObjectMember>" in combined
+        assert "ns0:" not in combined
+        root = ET.fromstring(combined.encode("utf-8"))
+        ids = [
+            b.get("{http://www.opengis.net/gml}id")
+            for b in root.iter("{http://www.opengis.net/citygml/building/2.0}Building")
+        ]
+        assert ids == ["test_building_1", "test_building_2"]
+
+    def test_combine_gml_files_namespace_mismatch_fallback(self, writable_cache_dir):
+        """Test DOM merge is used when namespace declarations differ."""
+        gml_dir = writable_cache_dir / "13101_千代田区" / "udx" / "bldg"
+        base = gml_dir / "53393580_bldg_001_op.gml"
+        other = writable_cache_dir / "other_prefix.gml"
+        other.write_text(
+            base.read_text(encoding="utf-8")
+            .replace("core:", "c:").replace("xmlns:core=", "xmlns:c=")
+            .replace("test_building_1", "renamed_prefix_building"),
+            encoding="utf-8"
+        )
+
+        combined = _combine_gml_files([base, other])
+        assert "test_building_1" in combined
+        assert "renamed_prefix_building" in combined
+        assert combined.count("cityObjectMember>") >= 4
+
+
 class TestCacheFallback:
     """Test cache miss and API fallback scenarios."""
 
@@ -15,8 +15,93 @@ Reference:
 https://www.stat.go.jp/data/mesh/gaiyou.html
 """
 
+from functools import lru_cache
 from typing import Tuple
 
+# Optional: NumPy for batch conversion
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Precomputed digit strings: indexing + join avoids format-spec parsing
+_D2 = tuple(f"{i:02d}" for i in range(100))
+_D1 = "0123456789"
+_B2 = tuple(b"%02d" % i for i in range(100))
+_B1 = tuple(b"%d" % i for i in range(10))
+
+
+
+def _in_table_range(p: int, q: int, *digits: int) -> bool:
+    """True if p/q fit the 2-digit tables and every other index one digit."""
+    if not (0 <= p < 100 and 0 <= q < 100):
+        return False
+    for d in digits:
+        if not 0 <= d < 10:
+            return False
+    return True
+
+
+def _format_out_of_range(p: int, q: int, *digits: int) -> str:
+    # Outside Japan the indices leave the table range (negative or 3 digits).
+    # Format them as plain integers so the result is visibly not a valid
+    # mesh code instead of wrapping around the lookup tables.
+    return f"{p:02d}{q:02d}" + "".join(str(d) for d in digits)
+
+
+# (dt, du) for the 3x3 grid around a 3rd mesh, row-major from south-west
+_NEIGHBOR_OFFSETS = tuple((dt, du) for dt in (-1, 0, 1) for du in (-1, 0, 1))
+
+
+def _compute_all_indices(lat: float, lon: float) -> Tuple[int, ...]:
+    """Compute every mesh index for lat/lon in a single pass
+
+    Args:
+        lat: Latitude in degrees
+        lon: Longitude in degrees
+
+    Returns:
+        (p, q, r, s, t, u, half_lat, half_lon, quarter_lat, quarter_lon)
+        - p, q: 1st mesh (2 digits each)
+        - r, s: 2nd mesh (1 digit each)
+        - t, u: 3rd mesh (1 digit each)
+        - half_*, quarter_*: 2x2 subdivision row/column (0 or 1)
+    """
+    # 1st mesh
+    p = int(lat * 60 / 40)
+    q = int(lon - 100)
+
+    # 2nd mesh indices within 1st mesh
+    lat_remainder1 = lat - (p * 40 / 60)
+    lon_remainder1 = lon - (100 + q)
+
+    r = int(lat_remainder1 * 60 / 5)
+    s = int(lon_remainder1 * 60 / 7.5)
+
+    # 3rd mesh indices within 2nd mesh
+    lat_remainder2 = lat_remainder1 - (r * 5 / 60)
+    lon_remainder2 = lon_remainder1 - (s * 7.5 / 60)
+
+    t = int(lat_remainder2 * 60 / 0.5)
+    u = int(lon_remainder2 * 60 / 0.75)
+
+    # 1/2 mesh within 3rd mesh
+    lat_remainder3 = lat_remainder2 - (t * 0.5 / 60)
+    lon_remainder3 = lon_remainder2 - (u * 0.75 / 60)
+
+    half_lat = int(lat_remainder3 / (0.25 / 60))
+    half_lon = int(lon_remainder3 / (0.375 / 60))
+
+    # 1/4 mesh within 1/2 mesh
+    lat_remainder4 = lat_remainder3 - (half_lat * 0.25 / 60)
+    lon_remainder4 = lon_remainder3 - (half_lon * 0.375 / 60)
+
+    quarter_lat = int(lat_remainder4 / (0.125 / 60))
+    quarter_lon = int(lon_remainder4 / (0.1875 / 60))
+
+    return p, q, r, s, t, u, half_lat, half_lon, quarter_lat, quarter_lon
+
 
 def latlon_to_mesh_1st(lat: float, lon: float) -> str:
     """Convert lat/lon to 1st mesh code (80km, 4 digits)
@@ -30,7 +115,9 @@ def latlon_to_mesh_1st(lat: float, lon: float) -> str:
     """
     p = int(lat * 60 / 40)
     q = int(lon - 100)
-    return f"{p:02d}{q:02d}"
+    if not _in_table_range(p, q):
+        return _format_out_of_range(p, q)
+    return _D2[p] + _D2[q]
 
 
 def latlon_to_mesh_2nd(lat: float, lon: float) -> str:
@@ -43,25 +130,20 @@ def latlon_to_mesh_2nd(lat: float, lon: float) -> str:
     Returns:
         6-digit mesh code (e.g., "533945")
     """
-    # 1st mesh
-    mesh1 = latlon_to_mesh_1st(lat, lon)
-
-    # Calculate 2nd mesh indices within 1st mesh
-    p = int(lat * 60 / 40)
-    q = int(lon - 100)
-
-    lat_remainder = lat - (p * 40 / 60)
-    lon_remainder = lon - (100 + q)
-
-    r = int(lat_remainder * 60 / 5)
-    s = int(lon_remainder * 60 / 7.5)
-
-    return f"{mesh1}{r}{s}"
+    p, q, r, s = _compute_all_indices(lat, lon)[:4]
+    if not _in_table_range(p, q, r, s):
+        return _format_out_of_range(p, q, r, s)
+    return "".join((_D2[p], _D2[q], _D1[r], _D1[s]))
 
 
+@lru_cache(maxsize=8192)
 def latlon_to_mesh_3rd(lat: float, lon: float) -> str:
     """Convert lat/lon to 3rd mesh code (1km, 8 digits)
 
+    Memoized on the exact (lat, lon) pair: repeated geocoding results for
+    the same address skip the arithmetic. ``latlon_to_mesh_3rd.cache_clear()``
+    resets the cache.
+
     Args:
         lat: Latitude in degrees
         lon: Longitude in degrees
@@ -69,114 +151,134 @@ def latlon_to_mesh_3rd(lat: float, lon: float) -> str:
     Returns:
         8-digit mesh code (e.g., "53394511")
     """
-    # 2nd mesh
-    mesh2 = latlon_to_mesh_2nd(lat, lon)
+    p, q, r, s, t, u = _compute_all_indices(lat, lon)[:6]
+    if not _in_table_range(p, q, r, s, t, u):
+        return _format_out_of_range(p, q, r, s, t, u)
+    return "".join((_D2[p], _D2[q], _D1[r], _D1[s], _D1[t], _D1[u]))
 
-    # Calculate 3rd mesh indices within 2nd mesh
-    p = int(lat * 60 / 40)
-    q = int(lon - 100)
 
-    lat_remainder1 = lat - (p * 40 / 60)
-    lon_remainder1 = lon - (100 + q)
+def latlon_to_mesh_3rd_bytes(lat: float, lon: float) -> bytes:
+    """Convert lat/lon to 3rd mesh code (1km, 8 digits) as ASCII bytes
 
-    r = int(lat_remainder1 * 60 / 5)
-    s = int(lon_remainder1 * 60 / 7.5)
+    Same code as latlon_to_mesh_3rd() without the str layer, for callers
+    that key caches or buffers on bytes (like latlon_to_mesh_3rd_batch()).
 
-    lat_remainder2 = lat_remainder1 - (r * 5 / 60)
-    lon_remainder2 = lon_remainder1 - (s * 7.5 / 60)
+    Args:
+        lat: Latitude in degrees
+        lon: Longitude in degrees
 
-    t = int(lat_remainder2 * 60 / 0.5)
-    u = int(lon_remainder2 * 60 / 0.75)
+    Returns:
+        8-byte mesh code (e.g., b"53394511")
+    """
+    p, q, r, s, t, u = _compute_all_indices(lat, lon)[:6]
+    if not _in_table_range(p, q, r, s, t, u):
+        return _format_out_of_range(p, q, r, s, t, u).encode("ascii")
+    return b"".join((_B2[p], _B2[q], _B1[r], _B1[s], _B1[t], _B1[u]))
 
-    return f"{mesh2}{t}{u}"
 
+def latlon_to_mesh_3rd_batch(lats, lons) -> "np.ndarray":
+    """Convert arrays of lat/lon to 3rd mesh codes (1km, 8 digits) in one pass
 
-def latlon_to_mesh_half(lat: float, lon: float) -> str:
-    """Convert lat/lon to 1/2 mesh code (500m, 9 digits)
+    Same arithmetic as latlon_to_mesh_3rd(), applied elementwise, so results
+    match the scalar function exactly. Valid for Japan (1st mesh "3000"-"6899").
 
     Args:
-        lat: Latitude in degrees
-        lon: Longitude in degrees
+        lats: Latitudes in degrees (array-like)
+        lons: Longitudes in degrees (array-like, same shape as lats)
 
     Returns:
-        9-digit mesh code (e.g., "533945111")
+        1-D array of dtype "|S8" (e.g., b"53394511"); ``.astype(str)`` for str
+
+    Raises:
+        ImportError: If numpy is not installed
+        ValueError: If a coordinate falls outside the 2-digit 1st mesh range
+            (the fixed-width |S8 result cannot hold the scalar functions'
+            out-of-range formatting)
     """
-    # 3rd mesh
-    mesh3 = latlon_to_mesh_3rd(lat, lon)
+    if not NUMPY_AVAILABLE:
+        raise ImportError("latlon_to_mesh_3rd_batch requires numpy")
 
-    # Calculate 1/2 mesh index within 3rd mesh
-    p = int(lat * 60 / 40)
-    q = int(lon - 100)
+    lats = np.asarray(lats, dtype=np.float64).ravel()
+    lons = np.asarray(lons, dtype=np.float64).ravel()
 
-    lat_remainder1 = lat - (p * 40 / 60)
-    lon_remainder1 = lon - (100 + q)
+    p = (lats * 60 / 40).astype(np.int64)
+    q = (lons - 100).astype(np.int64)
 
-    r = int(lat_remainder1 * 60 / 5)
-    s = int(lon_remainder1 * 60 / 7.5)
+    lat_remainder1 = lats - (p * 40 / 60)
+    lon_remainder1 = lons - (100 + q)
+
+    r = (lat_remainder1 * 60 / 5).astype(np.int64)
+    s = (lon_remainder1 * 60 / 7.5).astype(np.int64)
 
     lat_remainder2 = lat_remainder1 - (r * 5 / 60)
     lon_remainder2 = lon_remainder1 - (s * 7.5 / 60)
 
-    t = int(lat_remainder2 * 60 / 0.5)
-    u = int(lon_remainder2 * 60 / 0.75)
-
-    lat_remainder3 = lat_remainder2 - (t * 0.5 / 60)
-    lon_remainder3 = lon_remainder2 - (u * 0.75 / 60)
+    t = (lat_remainder2 * 60 / 0.5).astype(np.int64)
+    u = (lon_remainder2 * 60 / 0.75).astype(np.int64)
 
-    # 1/2 mesh: 2x2 subdivision (1=SW, 2=SE, 3=NW, 4=NE)
-    half_lat = int(lat_remainder3 / (0.25 / 60))
-    half_lon = int(lon_remainder3 / (0.375 / 60))
+    out_of_range = (p < 0) | (p > 99) | (q < 0) | (q > 99)
+    for idx in (r, s, t, u):
+        out_of_range |= (idx < 0) | (idx > 9)
+    if out_of_range.any():
+        i = int(np.argmax(out_of_range))
+        raise ValueError(
+            f"Coordinate outside the mesh code range: lat={lats[i]}, lon={lons[i]}"
+        )
 
-    half_code = half_lat * 2 + half_lon + 1
+    # Write ASCII digits into an (N, 8) byte buffer, then view as |S8
+    digits = np.empty((lats.size, 8), dtype=np.uint8)
+    digits[:, 0], digits[:, 1] = np.divmod(p, 10)
+    digits[:, 2], digits[:, 3] = np.divmod(q, 10)
+    digits[:, 4] = r
+    digits[:, 5] = s
+    digits[:, 6] = t
+    digits[:, 7] = u
+    digits += ord("0")
 
-    return f"{mesh3}{half_code}"
+    return digits.view("S8").ravel()
 
 
-def latlon_to_mesh_quarter(lat: float, lon: float) -> str:
-    """Convert lat/lon to 1/4 mesh code (250m, 10 digits)
+def latlon_to_mesh_half(lat: float, lon: float) -> str:
+    """Convert lat/lon to 1/2 mesh code (500m, 9 digits)
 
     Args:
         lat: Latitude in degrees
         lon: Longitude in degrees
 
     Returns:
-        10-digit mesh code (e.g., "5339451111")
+        9-digit mesh code (e.g., "533945111")
     """
-    # 1/2 mesh
-    mesh_half = latlon_to_mesh_half(lat, lon)
+    p, q, r, s, t, u, half_lat, half_lon = _compute_all_indices(lat, lon)[:8]
 
-    # Calculate 1/4 mesh index within 1/2 mesh
-    p = int(lat * 60 / 40)
-    q = int(lon - 100)
-
-    lat_remainder1 = lat - (p * 40 / 60)
-    lon_remainder1 = lon - (100 + q)
-
-    r = int(lat_remainder1 * 60 / 5)
-    s = int(lon_remainder1 * 60 / 7.5)
-
-    lat_remainder2 = lat_remainder1 - (r * 5 / 60)
-    lon_remainder2 = lon_remainder1 - (s * 7.5 / 60)
+    # 1/2 mesh: 2x2 subdivision (1=SW, 2=SE, 3=NW, 4=NE)
+    half_code = half_lat * 2 + half_lon + 1
 
-    t = int(lat_remainder2 * 60 / 0.5)
-    u = int(lon_remainder2 * 60 / 0.75)
+    if not _in_table_range(p, q, r, s, t, u, half_code):
+        return _format_out_of_range(p, q, r, s, t, u, half_code)
+    return "".join((_D2[p], _D2[q], _D1[r], _D1[s], _D1[t], _D1[u], _D1[half_code]))
 
-    lat_remainder3 = lat_remainder2 - (t * 0.5 / 60)
-    lon_remainder3 = lon_remainder2 - (u * 0.75 / 60)
 
-    half_lat = int(lat_remainder3 / (0.25 / 60))
-    half_lon = int(lon_remainder3 / (0.375 / 60))
+def latlon_to_mesh_quarter(lat: float, lon: float) -> str:
+    """Convert lat/lon to 1/4 mesh code (250m, 10 digits)
 
-    lat_remainder4 = lat_remainder3 - (half_lat * 0.25 / 60)
-    lon_remainder4 = lon_remainder3 - (half_lon * 0.375 / 60)
+    Args:
+        lat: Latitude in degrees
+        lon: Longitude in degrees
 
-    # 1/4 mesh: 2x2 subdivision (1=SW, 2=SE, 3=NW, 4=NE)
-    quarter_lat = int(lat_remainder4 / (0.125 / 60))
-    quarter_lon = int(lon_remainder4 / (0.1875 / 60))
+    Returns:
+        10-digit mesh code (e.g., "5339451111")
+    """
+    p, q, r, s, t, u, half_lat, half_lon, quarter_lat, quarter_lon = _compute_all_indices(lat, lon)
 
+    # 1/2 and 1/4 mesh: 2x2 subdivisions (1=SW, 2=SE, 3=NW, 4=NE)
+    half_code = half_lat * 2 + half_lon + 1
     quarter_code = quarter_lat * 2 + quarter_lon + 1
 
-    return f"{mesh_half}{quarter_code}"
+    if not _in_table_range(p, q, r, s, t, u, half_code, quarter_code):
+        return _format_out_of_range(p, q, r, s, t, u, half_code, quarter_code)
+    return "".join((
+        _D2[p], _D2[q], _D1[r], _D1[s], _D1[t], _D1[u], _D1[half_code], _D1[quarter_code]
+    ))
 
 
 def get_neighboring_meshes_3rd(mesh_code: str) -> list[str]:
@@ -187,47 +289,37 @@ def get_neighboring_meshes_3rd(mesh_code: str) -> list[str]:
 
     Returns:
         List of 9 mesh codes (center + 8 neighbors)
+
+    Raises:
+        ValueError: If mesh_code is not 8 ASCII digits
     """
-    if len(mesh_code) != 8:
+    if len(mesh_code) != 8 or not (mesh_code.isascii() and mesh_code.isdigit()):
         raise ValueError(f"Expected 8-digit 3rd mesh code, got: {mesh_code}")
 
+    # ASCII digits validated above: ord() - 48 instead of int() per digit
     mesh1 = mesh_code[:4]
-    r = int(mesh_code[4])
-    s = int(mesh_code[5])
-    t = int(mesh_code[6])
-    u = int(mesh_code[7])
+    r = ord(mesh_code[4]) - 48
+    s = ord(mesh_code[5]) - 48
+    t = ord(mesh_code[6]) - 48
+    u = ord(mesh_code[7]) - 48
 
     meshes = []
 
     # 3x3 grid around center
-    for dt in [-1, 0, 1]:
-        for du in [-1, 0, 1]:
-            new_t = t + dt
-            new_u = u + du
-            new_r = r
-            new_s = s
-
-            # Handle overflow/underflow for 3rd mesh
-            if new_t < 0:
-                new_t += 10
-                new_r -= 1
-            elif new_t >= 10:
-                new_t -= 10
-                new_r += 1
-
-            if new_u < 0:
-                new_u += 10
-                new_s -= 1
-            elif new_u >= 10:
-                new_u -= 10
-                new_s += 1
-
-            # Handle overflow/underflow for 2nd mesh
-            # (Simplified - doesn't handle 1st mesh boundaries)
-            if new_r < 0 or new_r >= 8 or new_s < 0 or new_s >= 8:
-                continue  # Skip meshes outside 2nd mesh boundaries
-
-            meshes.append(f"{mesh1}{new_r}{new_s}{new_t}{new_u}")
+    for dt, du in _NEIGHBOR_OFFSETS:
+        # Carry overflow/underflow of the 3rd mesh digit into the 2nd mesh
+        # (floor division: -1 -> (-1, 9), 10 -> (1, 0))
+        dr, new_t = divmod(t + dt, 10)
+        ds, new_u = divmod(u + du, 10)
+        new_r = r + dr
+        new_s = s + ds
+
+        # Handle overflow/underflow for 2nd mesh
+        # (Simplified - doesn't handle 1st mesh boundaries)
+        if new_r < 0 or new_r >= 8 or new_s < 0 or new_s >= 8:
+            continue  # Skip meshes outside 2nd mesh boundaries
+
+        meshes.append("".join((mesh1, _D1[new_r], _D1[new_s], _D1[new_t], _D1[new_u])))
 
     return meshes
 